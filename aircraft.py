@@ -0,0 +1,689 @@
+"""Modular aircraft concept
+
+Importing this module only defines the component models; call build_model()
+and solve() to size a design, or run it as a script for the full report.
+"""
+import numpy as np
+from gpkit import Model, Variable, Vectorize, VectorVariable
+
+def weight(component):
+    "A component's own weight, not that of any submodels it contains"
+    return component.W if hasattr(component, "W") else component["W"]
+
+class Aircraft(Model):
+    """The vehicle model
+
+    With spar_stations, the wing's spar is a SpanwiseTubeSpar of that many
+    stations per half, sized for the ultimate load on the whole aircraft.
+    """
+    def setup(self, spar_stations=None):
+        self.hull = Hull()
+        self.wing = Wing()
+        self.engine = Engine()
+        self.propeller = Propeller()
+        self.pilot = Pilot()
+        self.fuel_tank = FuelTank()
+        self.fuel = Fuel()
+        self.tail = Tail()
+        self.avionics = Avionics()
+        self.prop_tower = PropTower()
+        self.tail_boom = Beam()
+
+        self.components = [self.hull, self.engine, self.propeller, self.wing, self.pilot, self.tail, self.avionics, self.prop_tower, self.tail_boom]
+
+        W = Variable("W", "N", "weight")
+        self.weight = W
+        n_0 = Variable("n_0",0.3*0.7,"-")
+        wettedAreaRatio = Variable("wettedAreaRatio","-")
+        C_D0 = Variable("C_D0","-")
+        C_fe = Variable("C_fe",0.0065,"-","parasite drag per wetted area ratio")
+        g = Variable("g", 9.8, "m/s/s", "gravity")
+        W_MTO = Variable("W_MTO", "N", "weight with full fuel tank")
+        constraints = [
+            self.wing["S_wet"] >= self.wing["S"]*self.wing["k_wet"],
+            wettedAreaRatio >= (self.wing["S_wet"] + self.hull["S_wet"])/self.wing["S"],
+            C_D0 >= C_fe*wettedAreaRatio,
+            W_MTO >= W + g*self.fuel_tank["V"]*self.fuel["rho"]
+        ]
+        # fixed-value models must be in the constraint tree for gpkit to
+        # pick up their substitutions
+        models = [self.components, self.fuel_tank, self.fuel]
+        if spar_stations is None:
+            spar = self.wing.front_spar
+            return models, spar, spar.loading(W_MTO), constraints + [
+                W >= sum(weight(c) for c in self.components) + spar["W"],
+                spar["l"] >= self.wing["b"]]
+        self.spar = SpanwiseTubeSpar(spar_stations)
+        self.spar_load = self.spar.loading(W_MTO)
+        return models, self.spar, self.spar_load, constraints + [
+            W >= sum(weight(c) for c in self.components) + 2*self.spar["W"],
+            self.spar["l"] >= self.wing["b"]/2]
+
+    def dynamic(self, state):
+        "This component's performance model for a given state."
+        return AircraftP(self, state)
+
+class AircraftP(Model):
+    def setup(self, aircraft, state):
+        self.aircraft = aircraft
+        self.wing_aero = aircraft.wing.dynamic(state)
+        self.engine_p = aircraft.engine.dynamic(state)
+        self.propeller_p = aircraft.propeller.dynamic(state)
+
+        self.perf_models = [self.wing_aero,self.engine_p,self.propeller_p]
+        Wfuel = Variable("W_{fuel}", "N", "fuel weight")
+        Wburn = Variable("W_{burn}", "N", "segment fuel burn")
+        self.D = Variable("D","N")
+        self.Range = Variable("range","m")
+        self.z_bre = Variable("z_bre","-")
+        self.LD = Variable("LD","-")
+        return self.perf_models, [
+            aircraft.weight + Wfuel <= (0.5*state["\\rho"]*state["V"]**2
+                                        * self.wing_aero["C_L"]
+                                        * aircraft.wing["S"]),
+            # self.LD <= (aircraft.weight + Wfuel)/self.D,
+            self.D >= sum(p["D"] for p in self.perf_models) + 0.5*state["\\rho"]*state["V"]**2*aircraft["C_D0"]*aircraft.wing["S"],
+            self.propeller_p['P_in'] == self.engine_p.P,
+            Wburn/(state['g']*self.engine_p['mdot']) == self.Range/state['V'],
+            Wfuel <= state['g']*self.aircraft.fuel_tank['V']*self.aircraft.fuel['rho'], 
+            self.propeller_p["T"] >= self.D,
+            self.z_bre >= (state["g"]*self.Range*self.D)/(aircraft.fuel['h']*aircraft["n_0"]*aircraft.weight),
+            Wburn/aircraft.weight >= self.z_bre + (self.z_bre**2)/2 + (self.z_bre**3)/6 + (self.z_bre**4)/24,
+            # Stability
+            # X_G = X_Fh
+        ]
+
+class FlightState(Model):
+    "Context for evaluating flight physics"
+    def setup(self):
+        Variable("V","m/s", "true airspeed")
+        Variable("\\mu", 1.789e-5, "N*s/m^2", "dynamic viscosity")
+        Variable("\\rho", 1.225, "kg/m^3", "air density")
+        Variable("g", 9.8, "m/s/s", "gravity")
+
+class FlightSegment(Model):
+    "Combines a context (flight state) and a component (the aircraft)"
+    def setup(self, aircraft):
+        self.flightstate = FlightState()
+        self.aircraftp = aircraft.dynamic(self.flightstate)
+        return self.flightstate, self.aircraftp
+
+class Mission(Model):
+    """A takeoff segment followed by equal-length cruise segments
+
+    The takeoff segment covers 1% of the range; the remaining segments - 1
+    cruise segments split the range evenly.
+    """
+    def setup(self, aircraft, segments=4):
+        if segments < 2:
+            raise ValueError("a mission needs takeoff plus at least one"
+                             " cruise segment")
+        with Vectorize(segments):
+            fs = FlightSegment(aircraft)
+        self.flight_segments = fs
+        Vmin = Variable('Vmin',20.1168,'m/s')
+        Wburn = fs.aircraftp["W_{burn}"]
+        Wfuel = fs.aircraftp["W_{fuel}"]
+        self.takeoff_fuel = Wfuel[0]
+        self.range = Variable("range","m")
+        self.z_bre = Variable("z_bre","-")
+        self.aircraft = aircraft
+        return fs, [Wfuel[:-1] >= Wfuel[1:] + Wburn[:-1],
+                    Wfuel[-1] >= Wburn[-1],
+                    fs.aircraftp.Range[0] == 0.01*self.range,
+                    fs.flightstate['V'][0] <= Vmin, 
+                    fs.aircraftp.Range[1:] == self.range/(segments - 1)
+        ]
+
+class Scenarios(Model):
+    """One aircraft flying several missions, each in its own conditions
+
+    Each scenario is a dict of cruise FlightState values ("V", "rho", "mu",
+    "g"), the mission's takeoff speed limit "Vmin", a target "range" in m
+    (default 500 km) and an optional "name". FlightState values apply to
+    the cruise segments only; the takeoff segment keeps the defaults and
+    its speed is bounded by Vmin. The margin is the smallest fraction of
+    its target range any mission reaches, so maximizing it sizes the
+    aircraft for the hardest scenario.
+
+    Payload and structural load factor belong to the aircraft (Pilot.W,
+    the spar's N_factor) and are shared by every mission, so scenarios
+    can't vary them: set them to the most demanding case instead.
+    """
+    FLIGHT_STATE = {"V": "V", "rho": "\\rho", "mu": "\\mu", "g": "g"}
+
+    def setup(self, aircraft, scenarios, segments=4):
+        if not scenarios:
+            raise ValueError("at least one scenario is needed")
+        self.names = [sc.get("name", "scenario %d" % i)
+                      for i, sc in enumerate(scenarios)]
+        self.missions = []
+        for scenario in scenarios:
+            unknown = (set(scenario) - set(self.FLIGHT_STATE)
+                       - set(["Vmin", "range", "name"]))
+            if unknown:
+                raise ValueError("unknown scenario values %s" % sorted(unknown))
+            mission = Mission(aircraft, segments)
+            state = mission.flight_segments.flightstate
+            for key, name in self.FLIGHT_STATE.items():
+                if key in scenario:
+                    for var in state[name][1:]:
+                        mission.substitutions[var] = float(scenario[key])
+            if "Vmin" in scenario:
+                mission.substitutions[mission["Vmin"]] = scenario["Vmin"]
+            self.missions.append(mission)
+        self.targets = [sc.get("range", 500e3) for sc in scenarios]
+        target = VectorVariable(len(scenarios), "target", self.targets,
+                                "m", "target range")
+        self.margin = Variable("margin", "-", "smallest fraction of target range")
+        return self.missions, [self.margin <= m.range/target[i]
+                               for i, m in enumerate(self.missions)]
+
+class Wing(Model):
+    "Aircraft wing model"
+    def setup(self):
+        W = Variable("W", "N", "weight")
+        S = Variable("S", "m^2", "surface area")
+        S_wet = Variable("S_wet", "m^2", "wetted area")
+        rho = Variable("\\rho",0.425*9.8, "N/m^2", "areal density")
+        A = Variable("A", "-", "aspect ratio")
+        c = Variable("c", "m", "mean chord")
+        b = Variable("b", "m", "span")
+        # Raymer's 1.977 + 0.52 t/c; see geometry_substitutions
+        k_wet = Variable("k_wet", 1.977 + 0.52, "-", "wetted to planform area ratio")
+        self.W = W
+        self.front_spar = TubeSpar()
+        
+        # S == b*c follows from these two; stating it too leaves cvxopt a
+        # rank-deficient equality system
+        return [W >= S*rho,
+                c == (S/A)**0.5,
+                b == A*c]
+
+    def dynamic(self, state):
+        "Returns this component's performance model for a given state."
+        return WingAero(self, state)
+
+
+class WingAero(Model):
+    "Wing aerodynamics"
+    def setup(self, wing, state):
+        C_D = Variable("C_D", "-", "drag coefficient")
+        CL = Variable("C_L", "-", "lift coefficient")
+        e = Variable("e", "-", "Oswald efficiency")
+        Re = Variable("Re", "-", "Reynold's number")
+        D = Variable("D", "N", "drag force")
+        sigma = Variable("sigma","-","ground effect correction factor")  #p148 YBD
+        return [
+            e + (1.78*0.045*wing["A"]**0.68) <= 1.14, 
+            e >= 0.1,
+            wing["A"]<=3*1.38, #Raymer 12.6
+            C_D >= (0.074/(Re**0.2) + CL**2/(np.pi*wing["A"]*e)),
+            Re == state["\\rho"]*state["V"]*wing["c"]/state["\\mu"],
+            D >= 0.5*state["\\rho"]*state["V"]**2*C_D*wing["S"]
+        ]
+
+
+class Hull(Model):
+    "The thing that carries the fuel, engine, and payload"
+    def setup(self):
+        Variable("W", 101.99, "N", "weight")
+        Variable("S_wet", 5.1, "m^2")
+    def dynamic(self,hull,state):
+        return HullP(self,state)
+
+class HullP(Model):
+    def setup(self,hull,state):
+        D = Variable("D","N")
+        return []
+
+class Engine(Model):
+    def setup(self):
+        W = Variable("W",421.4,"N","weight")
+        P_max = Variable("P_max",26099,"W","max engine power output")
+        BSFC_min = Variable("BSFC_min",1.4359644493044238e-07,"kg/W/s","maximum brake specfic fuel consumption")
+    def dynamic(self,state):
+        return EngineP(self,state)
+
+class EngineP(Model):
+    def setup(self,engine,state):
+        mdot = Variable("mdot","kg/s","fuel mass flow")
+        self.P = Variable("P","W","engine power output")
+        throttle = Variable("throttle","-","throttle position")
+        D = Variable("D",1e-7,"N")
+        return [self.P <= mdot/engine["BSFC_min"],
+                self.P <= engine["P_max"],
+                throttle == self.P/engine["P_max"]]
+
+class Propeller(Model):
+    def setup(self):
+        W = Variable("W",50,"N","weight")
+        diameter = Variable("diameter",1.5,"m","Diameter")
+    def dynamic(self,state):
+        return PropellerP(self,state)
+
+class PropellerP(Model):
+    def setup(self,propeller,state):
+        # What the hell is a?
+        a = 0.8
+        T = Variable("T","N","thrust")
+        f = Variable("f","1/s","frequency")
+        P_in = Variable("P_in","W","power input")
+        n = Variable("n",0.8,"-","efficiency")
+        J = Variable("J","-","advance ratio")
+        J_max = Variable("J_max",1.5,"-","advance ratio limit")
+        D = Variable("D",1e-7,"N")
+        return [J == state['V']/(f*propeller["diameter"]),
+                f <= Variable("f_max",45,"1/s","prop speed limit"),
+                n <= a*J,
+                J <= J_max,
+                T<= P_in*n/state['V']]
+
+class Pilot(Model):
+    def setup(self):
+        W = Variable("W",735,"N","weight")
+
+class FuelTank(Model):
+    def setup(self):
+        V = Variable("V",0.036,"m^3","volume")
+
+class Fuel(Model):
+    def setup(self):
+        # Typical values for gasoline
+        h = Variable("h",42.448e6,"J/kg","heating value")
+        rho = Variable("rho",719.7,"kg/m^3","density")
+
+class Tail(Model):
+    def setup(self):
+        self.W = Variable("W",20*9.8,"N","weight")
+        self.horiz = Wing()
+        self.vert = Wing()
+        # surface sizes from sketch.vsp3's horizgeom and vertgeom
+        return [self.horiz, self.vert,
+                self.horiz["c"] == self.vert["c"],
+                self.W >= self.horiz.W + self.vert.W], {
+                    self.horiz["S"]: 1.125, self.horiz["A"]: 2,
+                    self.vert["S"]: 1.4}
+    def dynamic(self,state):
+        return TailP(self,state)
+
+class TailP(Model): 
+    def setup(self,tail,state):
+        self.horiz_model = tail.horiz.dynamic(state)
+        self.vert_model = tail.vert.dynamic(state)
+        self.perf_models = [self.horiz_model,self.vert_model]
+        return self.perf_models
+
+class Avionics(Model):
+    def setup(self):
+        W = Variable("W",98,"N","weight")
+
+class PropTower(Model):
+    def setup(self):
+        W = Variable("W",16*9.8,"N","weight")
+
+class Beam(Model):
+    def setup(self):
+        W = Variable("W", 10*9.8,"N", "weight")
+        A = Variable("A", "m^2", "cross sectional area")
+        l = Variable("l", 3.4,"m", "length")
+        self.material = CarbonFiber()
+        return self.material, [W == self.material["rho"]*A*l]
+
+class TubeSpar(Model):
+    "Tube spar spanning the wing, sized by its root bending moment"
+    def setup(self):
+        W = Variable("W", "N", "weight")
+        A = Variable("A", "m^2", "cross sectional area")
+        l = Variable("l", "m", "length")
+        r = Variable('r','m','radius')
+        r_upper = Variable('r_1upper',0.06,'m','radius limit')
+        t = Variable('t','m','thickness')
+        t_lower = Variable('t_lower',0.0001,'m','thickness lower limit')
+        I = Variable('I','m^4','second moment of area')
+        self.material = Aluminum_6061_T6()
+        return self.material, [W == self.material["rho"]*A*l,
+                A >= 2*3.141*r*t,
+                I <= 3.141*(r**3)*t,
+                r <= r_upper,
+                t >= t_lower
+              ]
+
+    def loading(self, L):
+        "The spar under a total lift L"
+        return TubeSparP(self, L)
+
+
+class TubeSparP(Model):
+    def setup(self,tubespar,L):
+        N_factor = Variable('N_factor',3,'-','load factor')
+        M_root = Variable("M_root","N*m","root moment")
+        s = Variable('s','N/m^2','maximum tensile stress')
+        FOS = Variable("FOS",1.5,"-","factor of safety")
+        return [M_root >= 0.125*N_factor*L*tubespar["l"],
+                s >= 0.5*M_root*tubespar["r"]/tubespar["I"],
+                s <= tubespar.material["ultimate_tensile"]/FOS]
+
+class SpanwiseTubeSpar(Model):
+    """Tube spar of one wing half, discretized into N stations
+
+    Station 0 is the root and N-1 the tip; radius and wall thickness vary
+    per station. See SpanwiseTubeSparP for its loading.
+    """
+    def setup(self, N=50):
+        if N < 2:
+            raise ValueError("a spanwise spar needs at least two stations")
+        self.N = N
+        with Vectorize(N):
+            r = Variable("r", "m", "radius")
+            t = Variable("t", "m", "wall thickness")
+            I = Variable("I", "m^4", "second moment of area")
+            A = Variable("A", "m^2", "cross sectional area")
+        W = Variable("W", "N", "weight")
+        l = Variable("l", "m", "length (semispan)")
+        r_upper = Variable("r_upper", 0.06, "m", "radius limit")
+        # keeps the unloaded tip from shrinking toward zero, which leaves
+        # cvxopt iterating without converging
+        r_lower = Variable("r_lower", 0.005, "m", "radius lower limit")
+        t_lower = Variable("t_lower", 0.0001, "m", "thickness lower limit")
+        self.material = Aluminum_6061_T6()
+        return self.material, [
+            I <= np.pi*r**3*t,
+            A >= 2*np.pi*r*t,
+            r <= r_upper,
+            r >= r_lower,
+            t >= t_lower,
+            # trapezoidal integral of area over the N-1 segments
+            W >= self.material["rho"]*l/(2*(N - 1))*(A[:-1] + A[1:]).sum()]
+
+    def loading(self, L):
+        "The spar under a total (both halves) lift L"
+        return SpanwiseTubeSparP(self, L)
+
+class SpanwiseTubeSparP(Model):
+    """Shear, moment, slope and deflection of a SpanwiseTubeSpar
+
+    Lift follows Schrenk's approximation (mean of uniform and elliptical)
+    and is integrated by the trapezoidal rule from the free tip to the
+    clamped root; slope and deflection are integrated back out to the tip.
+    """
+    def setup(self, spar, L):
+        N = spar.N
+        eta = np.linspace(0, 1, N)
+        shape = 0.5 + 0.5*(4/np.pi)*np.sqrt(1 - eta**2)
+        shape[-1] = 0.5  # the elliptical part vanishes at the tip
+        with Vectorize(N):
+            q = Variable("q", "N/m", "lift per unit span")
+            S = Variable("S", "N", "shear force")
+            M = Variable("M", "N*m", "bending moment")
+            theta = Variable("theta", "-", "slope")
+            w = Variable("w", "m", "deflection")
+            s = Variable("s", "N/m^2", "maximum tensile stress")
+        N_factor = Variable("N_factor", 3, "-", "ultimate load factor")
+        FOS = Variable("FOS", 1.5, "-", "factor of safety")
+        kappa = Variable("kappa", 0.2, "-", "tip deflection limit per semispan")
+        # GP variables must stay positive: free-end and clamped-end values
+        S_tip = Variable("S_tip", 1e-10, "N", "tip shear")
+        M_tip = Variable("M_tip", 1e-10, "N*m", "tip moment")
+        theta_root = Variable("theta_root", 1e-10, "-", "root slope")
+        w_root = Variable("w_root", 1e-10, "m", "root deflection")
+        l = spar["l"]
+        dy = l/(N - 1)
+        EI = spar.material["E"]*spar["I"]
+        return [q >= N_factor*L/(2*l)*shape,
+                S[:-1] >= S[1:] + dy*(q[:-1] + q[1:])/2,
+                S[-1] >= S_tip,
+                M[:-1] >= M[1:] + dy*(S[:-1] + S[1:])/2,
+                M[-1] >= M_tip,
+                theta[1:] >= theta[:-1] + dy*(M[1:]/EI[1:] + M[:-1]/EI[:-1])/2,
+                theta[0] >= theta_root,
+                w[1:] >= w[:-1] + dy*(theta[1:] + theta[:-1])/2,
+                w[0] >= w_root,
+                w[-1] <= kappa*l,
+                s >= M*spar["r"]/spar["I"],
+                s <= spar.material["ultimate_tensile"]/FOS]
+
+class CarbonFiber(Model):
+    def setup(self):
+        rho = Variable("rho",1550*9.8,"N/m^3")
+
+class Aluminum_6061_T6(Model):
+    def setup(self):
+        rho = Variable("rho",2700*9.8,"N/m^3")
+        ultimate_tensile = Variable("ultimate_tensile",310e6,"N/m^2")
+        E = Variable("E",68.9e9,"Pa","young's modulus")
+        return []
+
+def sweep_parameters(aircraft):
+    "Fixed variables commonly swept in trade studies, by name"
+    return {"FuelTank.V": aircraft.fuel_tank["V"],
+            "Engine.P_max": aircraft.engine["P_max"],
+            "Engine.W": aircraft.engine["W"],
+            "Pilot.W": aircraft.pilot["W"],
+            "Hull.S_wet": aircraft.hull["S_wet"],
+            "Hull.W": aircraft.hull["W"],
+            "Propeller.diameter": aircraft.propeller["diameter"],
+            "Engine.BSFC_min": aircraft.engine["BSFC_min"],
+            "Aircraft.n_0": aircraft["n_0"],
+            "Aircraft.C_fe": aircraft["C_fe"],
+            "Wing.k_wet": aircraft.wing["k_wet"]}
+
+def geometry_points(filename="sketch.vsp3", hull="FuselageGeom",
+                    wing="WingGeom", **scales):
+    """Geometry-consistent sweep points computed from a .vsp3 file
+
+    Keyword scales are length_scale, width_scale and height_scale of the
+    hull; scalars or arrays, one point per variant. Returns arrays keyed by
+    sweep_parameters names, for Sweep.run.
+    """
+    import geometry
+    hull = geometry.body(hull, filename).evaluate(**scales)
+    wing = geometry.wing(wing, filename).evaluate()
+    n = len(hull["S_wet"])
+    return {"Hull.S_wet": hull["S_wet"],
+            "Wing.k_wet": np.repeat(wing["k_wet"], n)}
+
+def geometry_substitutions(aircraft, filename="sketch.vsp3"):
+    "Substitutions replacing the geometry guesses with values from filename"
+    parameters = sweep_parameters(aircraft)
+    return dict((parameters[name], float(values[0])) for name, values
+                in geometry_points(filename).items())
+
+# design.des parameter IDs set from each sweep output (both wing halves' span)
+VSP_IDS = {"b": ["IRQEKLNIYLX", "FUGWYXQTPNJ"]}
+
+def sweep_outputs(aircraft, mission):
+    "Columns reported per sweep point"
+    return {"range": mission.range,
+            "W": aircraft.weight,
+            "S": aircraft.wing["S"],
+            "A": aircraft.wing["A"],
+            "b": aircraft.wing["b"]}
+
+def store_variables(model):
+    "Variables written per point to a ResultStore, by column name"
+    aircraft, fs = model.aircraft, model.mission.flight_segments
+    return {"range": model.mission.range,
+            "W": aircraft.weight,
+            "S": aircraft.wing["S"],
+            "A": aircraft.wing["A"],
+            "b": aircraft.wing["b"],
+            "W_{fuel}": fs.aircraftp["W_{fuel}"],
+            "mdot": fs.aircraftp.engine_p["mdot"],
+            "throttle": fs.aircraftp.engine_p["throttle"]}
+
+def build_model(segments=4, spar_stations=None):
+    "The range-maximizing aircraft and mission model"
+    aircraft = Aircraft(spar_stations)
+    mission = Mission(aircraft, segments)
+    # objective = MISSION.range[0] + MISSION.range[1] + MISSION.range[2] + MISSION.range[3]
+    model = Model(1/mission.range, [mission, aircraft])
+    model.aircraft = aircraft
+    model.mission = mission
+    return model
+
+def build_scenarios(scenarios, segments=4, spar_stations=None):
+    """One aircraft sized across several missions in a single solve
+
+    See Scenarios for the scenario dicts; the model has .aircraft and
+    .scenarios attributes.
+    """
+    aircraft = Aircraft(spar_stations)
+    scenarios = Scenarios(aircraft, scenarios, segments)
+    model = Model(1/scenarios.margin, [scenarios, aircraft])
+    model.aircraft = aircraft
+    model.scenarios = scenarios
+    return model
+
+def build_sweep(segments=4, compiled=False, spar_stations=None,
+                vectors=False, **kwargs):
+    """A Sweep over a freshly built model, e.g. as the DOE worker builder
+
+    With compiled=True the GP is compiled once and each point only updates
+    its coefficients (see compiled.CompiledSweep). With vectors=True the
+    rows hold the store_variables columns, per-segment ones included, so
+    run_doe can append them to a ResultStore as points finish.
+    """
+    from sweep import Sweep
+    from compiled import CompiledSweep
+    model = build_model(segments, spar_stations)
+    cls = CompiledSweep if compiled else Sweep
+    if vectors:
+        outputs = store_variables(model)
+    else:
+        outputs = sweep_outputs(model.aircraft, model.mission)
+    return cls(model, outputs, sweep_parameters(model.aircraft), **kwargs)
+
+def solve(model=None, diagnostics="on-failure", cache=None, verbosity=0,
+          telemetry=None, solver=None):
+    """Solves the model, building it if not given
+
+    `diagnostics` is "always", "on-failure" or "never" (see diagnostics.py);
+    a failed solve raises SolveFailed carrying the diagnosis report.
+    `solver` is a SolverConfig choosing backend and tolerances.
+    """
+    import diagnostics as diag
+    from telemetry import NULL
+    telemetry = telemetry or NULL
+    if model is None:
+        with telemetry.phase("build"):
+            model = build_model()
+    key = None
+    if cache is not None:
+        from cache import model_key, rekeyed
+        from solvers import DEFAULT
+        key = model_key(model, solver=solver or DEFAULT)
+        sol = cache.get(key)
+        telemetry.emit("cache", hit=sol is not None)
+        if sol is not None:
+            return rekeyed(sol, model)
+    sol = diag.solve(model, diagnostics, verbosity, telemetry, solver)
+    if key:
+        cache.put(key, sol)
+    return sol
+
+def main(argv=None):
+    "Command-line entry point: solve, print the report, update design.des"
+    import json
+    import argparse
+    from vsp import updateOpenVSP
+    from diagnostics import SolveFailed
+    from solvers import SolverConfig
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--diagnostics", default="on-failure",
+                        choices=["always", "on-failure", "never"],
+                        help="when to run relaxed-solve diagnostics")
+    parser.add_argument("--no-vsp", action="store_true",
+                        help="leave design.des untouched")
+    parser.add_argument("--segments", type=int, default=4,
+                        help="flight segments in the mission")
+    parser.add_argument("--telemetry", metavar="FILE",
+                        help="append JSON-line phase events to FILE")
+    parser.add_argument("--profile", action="append", default=[],
+                        metavar="PHASE", help="run PHASE under cProfile")
+    parser.add_argument("--solver", choices=["cvxopt", "mosek_conif", "mosek_cli"],
+                        help="GP solver backend (default: gpkit's choice)")
+    parser.add_argument("--reltol", type=float,
+                        help="interior-point relative tolerance")
+    parser.add_argument("--sensitivities", metavar="CSV",
+                        help="write fixed-variable sensitivities to CSV")
+    parser.add_argument("--spar-stations", type=int, metavar="N",
+                        help="size a spanwise spar with N stations")
+    parser.add_argument("--scenarios", metavar="JSON",
+                        help="size for every mission in a JSON list of"
+                        " scenarios (see Scenarios)")
+    parser.add_argument("--geometry", metavar="VSP3",
+                        help="take wetted areas from a .vsp3 file")
+    parser.add_argument("--presolve", action="store_true",
+                        help="fold fixed variables and prune redundant"
+                        " constraints before solving")
+    args = parser.parse_args(argv)
+    if args.presolve and args.sensitivities:
+        parser.error("--presolve folds fixed variables away, so it can't"
+                     " report their --sensitivities")
+
+    from telemetry import Telemetry
+    telemetry = Telemetry(args.telemetry, args.profile)
+    try:
+        with telemetry.phase("build", segments=args.segments):
+            if args.scenarios:
+                with open(args.scenarios) as f:
+                    M = build_scenarios(json.load(f), args.segments,
+                                        args.spar_stations)
+            else:
+                M = build_model(args.segments, args.spar_stations)
+        AC = M.aircraft
+        if args.scenarios:
+            missions = zip(M.scenarios.names, M.scenarios.missions,
+                           [0.001*t for t in M.scenarios.targets])
+        else:
+            missions = [("Mission", M.mission, None)]
+        if args.geometry:
+            M.substitutions.update(geometry_substitutions(AC, args.geometry))
+        if args.presolve:
+            from presolve import presolve, declared
+            M, _ = presolve(M, declared(M), verbosity=1)
+        try:
+            solver = SolverConfig(args.solver, reltol=args.reltol)
+        except ValueError as e:
+            parser.error(str(e))
+        try:
+            SOL = solve(M, args.diagnostics, telemetry=telemetry,
+                        solver=solver)
+        except SolveFailed as e:
+            print("Solve failed: %s" % e)
+            print(json.dumps(e.report, indent=1, sort_keys=True,
+                             default=float))
+            raise SystemExit(1)
+        if "diagnostics" in SOL:
+            print(json.dumps(SOL["diagnostics"], indent=1, sort_keys=True,
+                             default=float))
+        print(SOL.table())
+        #We want the range to be 500 km, as determined by the crossing from Greenland to Iceland and Iceland to Faroe Islands
+        #these crossings are around 480 km, which means we need to have an ideal cruise in that wave height of 500 km
+        #without that, no point building the thing
+        for name, MISSION, rangeObjective in missions:
+            rangeObjective = rangeObjective or 500
+            rangeInKm = SOL(MISSION.range).to("km").magnitude
+            print(name + ': range is ' + str(rangeInKm)+' km')
+            print('At %s percent of range goal'%str(100*rangeInKm/rangeObjective))
+
+        if args.sensitivities:
+            from sensitivity import export_sensitivities
+            export_sensitivities(SOL, args.sensitivities)
+
+        if not args.no_vsp:
+            b = SOL(AC.wing["b"]).magnitude
+            updateOpenVSP(dict((key, b) for key in VSP_IDS["b"]))
+
+        # print('MTOW of ' + str(sol(W)))
+        # print('Cruise LD of '+str(sol(C_L/C_D)))
+        # W_fuelsol = sol(MISSION[])
+        # W_zfwsol = sol(W_zfw)
+        # print('Full fuel fraction of ' +str(W_fuelsol/(W_zfwsol+W_fuelsol)))
+        return SOL
+    finally:
+        telemetry.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Timing benchmarks for the aircraft models"""
+import os
+import json
+import argparse
+import subprocess
+from time import time
+
+
+def timed(f, *args, **kwargs):
+    "Calls f, returning its result and the wall-clock seconds it took"
+    start = time()
+    result = f(*args, **kwargs)
+    return result, time() - start
+
+
+def segments(counts=(4, 10, 20, 50, 100), repeats=3):
+    """Build and solve times of the modular model against mission segment count
+
+    Each segment adds about 20 free variables. As for `stations`, cvxopt's
+    dense Hessian makes solve time grow roughly as the cube of that count.
+    """
+    from aircraft import build_model
+    rows = []
+    for n in counts:
+        build = solve = float("inf")
+        for _ in range(repeats):
+            model, t_build = timed(build_model, n)
+            _, t_solve = timed(model.solve, verbosity=0)
+            build, solve = min(build, t_build), min(solve, t_solve)
+        rows.append((n, build, solve))
+        print("%4d segments: build %7.3f s, solve %7.3f s" % (n, build, solve))
+    return rows
+
+
+def stations(counts=(10, 25, 50, 100, 200), repeats=3):
+    """Build and solve times of a lone SpanwiseTubeSpar against station count
+
+    Time per station is printed too. It grows with N: cvxopt's GP solver
+    assembles and factors a dense Hessian, so solve time goes roughly as
+    N^3 however sparse the constraints are.
+    """
+    from gpkit import Model, Variable
+    from aircraft import SpanwiseTubeSpar
+    rows = []
+    for n in counts:
+        def build():
+            L = Variable("L", 3000, "N", "lift")
+            spar = SpanwiseTubeSpar(n)
+            spar.substitutions[spar["l"]] = 6.5
+            return Model(spar["W"], [spar, spar.loading(L)])
+        build_time = solve_time = float("inf")
+        for _ in range(repeats):
+            model, t_build = timed(build)
+            _, t_solve = timed(model.solve, verbosity=0)
+            build_time = min(build_time, t_build)
+            solve_time = min(solve_time, t_solve)
+        rows.append((n, build_time, solve_time))
+        print("%4d stations: build %7.3f s, solve %7.3f s (%.2f ms/station)"
+              % (n, build_time, solve_time,
+                 1e3*(build_time + solve_time)/n))
+    return rows
+
+
+def phases(build, repeats=3):
+    """Best-of-repeats seconds for each phase of building and solving a model
+
+    Phases: build (Python model construction), compile (GP/SP assembly),
+    diagnose (diagnostics.diagnose's relaxed solves), solve (the solver,
+    including sequential GP iterations) and table (SOL.table() formatting).
+    """
+    from diagnostics import diagnose
+    from sweep import is_signomial
+    best = {}
+    for _ in range(repeats):
+        model, t = timed(build)
+        times = {"build": t}
+        signomial = is_signomial(model)
+        _, times["compile"] = timed(model.sp if signomial else model.gp,
+                                    verbosity=0)
+        _, times["diagnose"] = timed(diagnose, model)
+        solve = model.localsolve if signomial else model.solve
+        sol, times["solve"] = timed(solve, verbosity=0)
+        _, times["table"] = timed(sol.table)
+        for phase, t in times.items():
+            best[phase] = min(best.get(phase, t), t)
+    return best
+
+
+def solvers(build, reltol=None, repeats=3):
+    """Solve time and objective of a model on every installed backend
+
+    Objectives are compared as relative differences from the first
+    backend's.
+    """
+    from solvers import SolverConfig, available
+    from sweep import is_signomial
+    rows = []
+    for backend in available():
+        config = SolverConfig(backend, reltol=reltol)
+        best = float("inf")
+        for _ in range(repeats):
+            model = build()
+            sol, t = timed(config.solve, model, is_signomial(model))
+            best = min(best, t)
+        cost = float(getattr(sol["cost"], "magnitude", sol["cost"]))
+        rows.append((backend, best, cost))
+    for backend, t, cost in rows:
+        print("%-10s %8.3f s  cost %.6g  (%+.2e relative)"
+              % (backend, t, cost, cost/rows[0][2] - 1))
+    return rows
+
+
+def models():
+    "The benchmarked models, by name"
+    import aircraft
+    import ekranoopt
+    return {"modular": aircraft.build_model,
+            "ekranoopt": ekranoopt.build_model}
+
+
+def commit():
+    "The current git commit, or None outside a repository"
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"]).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def record(results, filename="bench.json"):
+    "Appends a run to the JSON history, returning the previous run"
+    history = []
+    if os.path.exists(filename):
+        with open(filename) as f:
+            history = json.load(f)
+    previous = history[-1] if history else None
+    history.append({"commit": commit(), "time": time(), "results": results})
+    with open(filename, "w") as f:
+        json.dump(history, f, indent=1, sort_keys=True)
+    return previous
+
+
+def regressions(results, previous, tolerance=0.2):
+    "(model, phase, old, new) for phases slower than previous by > tolerance"
+    slower = []
+    for name, times in sorted(results.items()):
+        old_times = previous["results"].get(name, {}) if previous else {}
+        for phase, t in sorted(times.items()):
+            old = old_times.get(phase)
+            if old and t > old*(1 + tolerance):
+                slower.append((name, phase, old, t))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command")
+    seg = commands.add_parser("segments",
+                              help=segments.__doc__.split("\n")[0])
+    seg.add_argument("counts", type=int, nargs="*",
+                     default=[4, 10, 20, 50, 100])
+    seg.add_argument("--repeats", type=int, default=3)
+    sta = commands.add_parser("stations",
+                              help=stations.__doc__.split("\n")[0])
+    sta.add_argument("counts", type=int, nargs="*",
+                     default=[10, 25, 50, 100, 200])
+    sta.add_argument("--repeats", type=int, default=3)
+    pha = commands.add_parser("phases", help=phases.__doc__.split("\n")[0])
+    pha.add_argument("--repeats", type=int, default=3)
+    pha.add_argument("--history", default="bench.json",
+                     help="JSON file tracking results across commits")
+    pha.add_argument("--tolerance", type=float, default=0.2,
+                     help="fractional slowdown flagged as a regression")
+    sol = commands.add_parser("solvers",
+                              help=solvers.__doc__.split("\n")[0])
+    sol.add_argument("--model", choices=["modular", "ekranoopt"],
+                     default="modular")
+    sol.add_argument("--reltol", type=float)
+    sol.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+    if args.command == "solvers":
+        solvers(models()[args.model], args.reltol, args.repeats)
+    elif args.command == "segments":
+        segments(args.counts, args.repeats)
+    elif args.command == "stations":
+        stations(args.counts, args.repeats)
+    elif args.command == "phases":
+        results = dict((name, phases(build, args.repeats))
+                       for name, build in models().items())
+        for name, times in sorted(results.items()):
+            print(name + ": " + ", ".join("%s %.3f s" % (p, times[p])
+                                          for p in sorted(times)))
+        slower = regressions(results, record(results, args.history),
+                             args.tolerance)
+        for name, phase, old, new in slower:
+            print("REGRESSION %s %s: %.3f s -> %.3f s" % (name, phase, old, new))
+        if slower:
+            raise SystemExit(1)
+    else:
+        parser.print_help()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Solution cache keyed on model structure and fixed-variable values"""
+import os
+import re
+import hashlib
+import pickle
+from collections import OrderedDict
+import numpy as np
+from gpkit.keydict import KeyDict
+from gpkit.solution_array import SolutionArray
+
+
+def _lineage(key):
+    "(model name, instance number) pairs a variable was declared under"
+    if hasattr(key, "lineage"):
+        return key.lineage or ()
+    return tuple(zip(key.descr.get("models", ()),
+                     key.descr.get("modelnums", ())))
+
+
+def renumbering(varkeys, inverse=False):
+    """A function renumbering instance numbers in printed text
+
+    gpkit numbers every instance of a Model subclass for the life of the
+    process, so a second build of the same model prints as Mission1.range
+    where the first printed Mission.range. Each model name's instance
+    numbers are replaced by their rank among the numbers in varkeys;
+    `inverse` gives the function restoring them.
+    """
+    numbers = {}
+    for key in varkeys:
+        for name, num in _lineage(key):
+            numbers.setdefault(name, set()).add(num)
+    tokens = {}
+    for name, nums in numbers.items():
+        for rank, num in enumerate(sorted(nums)):
+            old, new = name + (str(num) if num else ""), name + (
+                str(rank) if rank else "")
+            if old != new:
+                tokens[new if inverse else old] = old if inverse else new
+    if not tokens:
+        return lambda text: text
+    pattern = re.compile(r"(?<![\w.])(%s)(?!\w)" % "|".join(
+        re.escape(t) for t in sorted(tokens, key=len, reverse=True)))
+    return lambda text: pattern.sub(lambda m: tokens[m.group(1)], text)
+
+
+def structure_key(model):
+    "Hash of a model's constraints, independent of fixed-variable values"
+    text = renumbering(model.varkeys)(str(model))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def model_key(model, structure=None, solver=None):
+    """Canonical hash of a model's constraints and all substitutions
+
+    Pass a precomputed `structure_key` to skip re-hashing the constraints
+    when only substitutions change between calls, and the SolverConfig
+    used so solutions from different backends or tolerances are kept apart.
+    """
+    h = hashlib.sha1((structure or structure_key(model)).encode("utf-8"))
+    if solver is not None:
+        h.update(solver.signature().encode("utf-8"))
+    rename = renumbering(model.varkeys)
+    subs = sorted((rename(str(k)),
+                   np.asarray(getattr(v, "magnitude", v)).tolist())
+                  for k, v in model.substitutions.items())
+    for name, value in subs:
+        h.update(("%s=%r;" % (name, value)).encode("utf-8"))
+    return h.hexdigest()
+
+
+def rekeyed(sol, model):
+    """sol with its variables re-keyed onto model's varkeys
+
+    A cached solution may come from an earlier build of the same model,
+    whose varkeys carry other instance numbers; reading the new model's
+    variables from it would silently return 1.0. Keys are matched by
+    their renumbered names, which is what `model_key` hashes.
+    """
+    if all(key in model.varkeys for key in sol["freevariables"]):
+        return sol
+    old = renumbering(sol["variables"])
+    new = renumbering(model.varkeys)
+    current = {}
+    for key in model.varkeys:
+        current[new(str(key))] = key
+        if key.veckey is not None:
+            current[new(str(key.veckey))] = key.veckey
+
+    def move(keydict):
+        return KeyDict((current[old(str(k))], v) for k, v in keydict.items())
+
+    copy = SolutionArray(sol)
+    copy.modelstr = str(model)
+    for name in ("freevariables", "constants", "variables"):
+        copy[name] = move(sol[name])
+    sens = dict(sol["sensitivities"])
+    for name in ("variables", "constants", "variablerisk"):
+        if name in sens:
+            sens[name] = move(sens[name])
+    if "constraints" in sens:
+        constraints = {new(str(c)): c for c in model.flat()}
+        sens["constraints"] = {constraints.get(old(str(c)), c): v
+                               for c, v in sens["constraints"].items()}
+    if "models" in sens:
+        restore = renumbering(model.varkeys, inverse=True)
+        sens["models"] = {restore(old(name)): v
+                          for name, v in sens["models"].items()}
+    copy["sensitivities"] = sens
+    copy["cost function"] = model.cost
+    return copy
+
+
+class SolutionCache(object):
+    """In-memory LRU of SolutionArrays backed by a directory of pickles
+
+    Arguments
+    ---------
+    directory : str
+        Where solutions are persisted; None keeps the cache in memory only
+    maxsize : int
+        Solutions held in memory
+    maxdisk : int
+        Solution files kept on disk; least recently used are removed first
+    """
+    def __init__(self, directory=".solutions", maxsize=128, maxdisk=10000):
+        self.directory = directory
+        self.maxsize = maxsize
+        self.maxdisk = maxdisk
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def get(self, key):
+        "The stored solution for key, or None"
+        if key in self.memory:
+            sol = self.memory.pop(key)
+            self.memory[key] = sol
+            self.hits += 1
+            return sol
+        if self.directory and os.path.exists(self.path(key)):
+            with open(self.path(key), "rb") as f:
+                sol = pickle.load(f)
+            os.utime(self.path(key), None)  # mark as recently used
+            self.remember(key, sol)
+            self.hits += 1
+            return sol
+        self.misses += 1
+        return None
+
+    def put(self, key, sol):
+        "Stores a solution in memory and on disk"
+        self.remember(key, sol)
+        if self.directory:
+            with open(self.path(key), "wb") as f:
+                pickle.dump(sol, f, pickle.HIGHEST_PROTOCOL)
+            self.evict()
+
+    def remember(self, key, sol):
+        self.memory.pop(key, None)
+        self.memory[key] = sol
+        while len(self.memory) > self.maxsize:
+            self.memory.popitem(last=False)
+
+    def evict(self):
+        "Removes the least recently used files beyond maxdisk"
+        files = [os.path.join(self.directory, f)
+                 for f in os.listdir(self.directory) if f.endswith(".pkl")]
+        if len(files) <= self.maxdisk:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - self.maxdisk]:
+            os.remove(path)
+
+    def clear(self):
+        "Drops every stored solution and resets the counters"
+        self.memory.clear()
+        if self.directory:
+            for f in os.listdir(self.directory):
+                if f.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, f))
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self.memory)
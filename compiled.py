@@ -0,0 +1,123 @@
+"""A GP compiled once and re-solved by updating its coefficient vector"""
+import copy
+import hashlib
+import warnings
+import numpy as np
+from cache import rekeyed
+from sweep import Sweep
+
+
+def magnitude(value):
+    return getattr(value, "magnitude", value)
+
+
+class CompiledSweep(Sweep):
+    """Sweep of a GP whose matrices are built once
+
+    Substituting a fixed variable only rescales the coefficients of the
+    monomials it appears in: c_i' = c_i (v'/v)**e_i. The exponents e_i of
+    every swept parameter are found at construction by compiling the GP
+    with that value scaled by e and by 1/e, after which each point costs a
+    vector update and the solver call alone.
+
+    The rescaling only holds where a parameter's effect on every
+    coefficient is a power law. When gpkit merges it into a sum of fixed
+    terms (e.g. Pilot.W in W >= sum of component weights) the two probes
+    disagree, and points that vary such a parameter are solved as a plain
+    Sweep does, with a warning at construction.
+
+    Only scalar parameters of geometric (not signomial) models are
+    supported, and only parameters listed in `parameters` may vary.
+    Solutions carry the updated cost, but their "constants" and constant
+    sensitivities are those of the template point.
+    """
+    def __init__(self, model, outputs, parameters, **kwargs):
+        kwargs["signomial"] = False
+        super(CompiledSweep, self).__init__(model, outputs, parameters,
+                                            **kwargs)
+        self.names = list(parameters)
+        self.base = np.array([float(magnitude(model.substitutions[parameters[n]]))
+                              for n in self.names])
+        self.gp = model.gp(verbosity=0)
+        self.cs = np.asarray(self.gp.cs, dtype=float)
+        exponents = []
+        self.uncompiled = []
+        for name, value in zip(self.names, self.base):
+            probes = [self.probe(parameters[name], value*scale)
+                      for scale in (np.e, 1/np.e)]
+            if (any(cs is None for cs in probes)
+                    or not np.allclose(probes[0], -probes[1],
+                                       rtol=1e-6, atol=1e-9)):
+                self.uncompiled.append(name)
+                exponents.append(np.zeros(len(self.cs)))
+            else:
+                exponents.append(probes[0])
+        self.exponents = np.array(exponents).T  # monomials x parameters
+        if self.uncompiled:
+            warnings.warn("the GP's coefficients are not a power law of %s;"
+                          " points varying them are solved uncompiled"
+                          % ", ".join(self.uncompiled))
+
+    def probe(self, key, value):
+        """log(c'/c) of each coefficient with key set to value, or None
+        if the GP's monomials change"""
+        model = self.model
+        original = model.substitutions[key]
+        model.substitutions[key] = value
+        try:
+            gp = model.gp(verbosity=0)
+        finally:
+            model.substitutions[key] = original
+        if len(gp.cs) != len(self.cs) or list(gp.exps) != list(self.gp.exps):
+            return None
+        return np.log(np.asarray(gp.cs, dtype=float)/self.cs)
+
+    def coefficients(self, substitutions):
+        "The GP's coefficient vector at the given parameter values"
+        logratio = np.zeros(len(self.names))
+        for name, value in substitutions.items():
+            i = self.names.index(name)
+            logratio[i] = np.log(float(magnitude(value))/self.base[i])
+        return self.cs*np.exp(self.exponents.dot(logratio))
+
+    def point_key(self, substitutions):
+        "Cache key of a compiled solve, kept apart from full solves'"
+        h = hashlib.sha1(("compiled:" + self.structure).encode("utf-8"))
+        h.update(self.solver.signature().encode("utf-8"))
+        for name in sorted(substitutions):
+            h.update(("%s=%r;" % (name, float(magnitude(substitutions[name]))
+                                  )).encode("utf-8"))
+        return h.hexdigest()
+
+    def solve(self, substitutions, verbosity=0, x0=None, point=None):
+        "Solves at a point by swapping coefficients; x0 is unused by GPs"
+        if any(name in self.uncompiled for name in substitutions):
+            return super(CompiledSweep, self).solve(substitutions, verbosity,
+                                                    x0, point)
+        key = None
+        if self.cache is not None:
+            with self.telemetry.phase("cache", point=point) as event:
+                key = self.point_key(substitutions)
+                sol = self.cache.get(key)
+                event["hit"] = sol is not None
+            if sol is not None:
+                return rekeyed(sol, self.model), 0
+        with self.telemetry.phase("substitute", point=point):
+            gp = copy.copy(self.gp)
+            gp.cs = self.coefficients(substitutions)
+        with self.telemetry.phase("solve", point=point) as event:
+            with self.solver.applied():
+                sol = gp.solve(solver=self.solver.solver, verbosity=verbosity)
+            sol["cost"] = self.cost(gp, sol)
+            event["iterations"] = 1
+        if key:
+            self.cache.put(key, sol)
+        return sol, 1
+
+    @staticmethod
+    def cost(gp, sol):
+        "Objective value from the updated coefficients"
+        x = sol["freevariables"]
+        return sum(gp.cs[i]*np.prod([magnitude(x[k])**e
+                                     for k, e in gp.exps[i].items()])
+                   for i in np.flatnonzero(gp.p_idxs == 0))
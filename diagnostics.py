@@ -0,0 +1,150 @@
+"""Failure diagnosis by relaxed solves, run according to a policy"""
+import numpy as np
+from gpkit import Model
+from gpkit.constraints.relax import ConstraintsRelaxedEqually, ConstantsRelaxed
+from telemetry import NULL, iteration_times
+from solvers import DEFAULT, SOLVE_ERRORS
+
+# always: diagnose every solve; on-failure: only failed solves; never: skip
+POLICIES = ("always", "on-failure", "never")
+
+
+class SolveFailed(RuntimeWarning):
+    "A solve that did not reach optimality, carrying its diagnosis report"
+    def __init__(self, message, report=None):
+        super(SolveFailed, self).__init__(message)
+        self.report = report
+
+
+def magnitude(value):
+    return getattr(value, "magnitude", value)
+
+
+def relaxations(sol, relaxvars):
+    """Solved value of each relaxation variable
+
+    Read one at a time: gpkit >= 1.0 leaves an array of separately
+    declared variables unevaluated.
+    """
+    return np.array([float(magnitude(sol(v))) for v in relaxvars])
+
+
+def flat_constraints(model):
+    "A model's individual constraints, in order, on any gpkit version"
+    try:
+        return list(model.flat(constraintsets=False))
+    except TypeError:  # gpkit >= 1.0's flat() yields only constraints
+        return list(model.flat())
+
+
+def leaves(constraint):
+    "A relaxed constraint's scalar parts; vector constraints relax to lists"
+    if isinstance(constraint, list):
+        return [leaf for c in constraint for leaf in leaves(c)]
+    return [constraint]
+
+
+def diagnose(model, threshold=1.01, verbosity=0, tight=1e-3):
+    """What must be relaxed for the model to solve, as a dict
+
+    Like M.debug(), solves the model with its constraints and then every
+    fixed variable allowed to relax under a steep penalty, but returns the
+    relaxations above `threshold` instead of printing them:
+
+        {"constraints": [{"constraint": str, "relaxation": factor}, ...],
+         "constants": [{"variable": str, "value": v, "relaxation": factor},
+                       ...]}
+
+    Constraints are relaxed by one common factor, as gpkit's per-constraint
+    relaxation fails on vector constraints; those reported are the ones
+    whose relaxed form binds, with sensitivity above `tight`. A relaxation
+    problem that itself fails is reported under "errors".
+    """
+    report = {"constraints": [], "constants": [], "errors": []}
+
+    feas = ConstraintsRelaxedEqually(model)
+    try:
+        sol = Model(feas.relaxvar**30*model.cost,
+                    feas).solve(verbosity=verbosity)
+    except SOLVE_ERRORS as e:
+        report["errors"].append("constraint relaxation: %s" % e)
+    else:
+        factor = float(magnitude(sol(feas.relaxvar)))
+        sens = sol["sensitivities"]["constraints"]
+        constraints = flat_constraints(model)
+        for constraint, relaxed in zip(constraints,
+                                       feas["relaxed constraints"]):
+            binding = [np.max(np.abs(sens[c])) for c in leaves(relaxed)
+                       if c in sens]
+            if factor >= threshold and binding and max(binding) >= tight:
+                report["constraints"].append(
+                    {"constraint": str(constraint), "relaxation": factor})
+
+    # ConstantsRelaxed blanks each freed element of a vector substitution
+    # in place, so it is given copies and the model keeps its arrays
+    arrays = dict((k, v) for k, v in model.substitutions.items()
+                  if isinstance(v, np.ndarray))
+    model.substitutions.update((k, v.copy()) for k, v in arrays.items())
+    try:
+        feas = ConstantsRelaxed(model)
+    finally:
+        model.substitutions.update(arrays)
+    try:
+        sol = Model(feas.relaxvars.prod()**30*model.cost,
+                    feas).solve(verbosity=verbosity)
+    except SOLVE_ERRORS as e:
+        report["errors"].append("constant relaxation: %s" % e)
+    else:
+        factors = relaxations(sol, feas.relaxvars)
+        # gpkit >= 1.0 calls the relaxed constants freedvars
+        origvars = getattr(feas, "origvars", None)
+        if origvars is None:
+            origvars = [v.key for v in feas.freedvars]
+        for var, factor in zip(origvars, factors):
+            if factor >= threshold:
+                report["constants"].append(
+                    {"variable": str(var),
+                     "value": np.mean(magnitude(model.substitutions[var])),
+                     "relaxation": float(factor)})
+    return report
+
+
+def solve(model, policy="on-failure", verbosity=0, telemetry=None,
+          solver=None):
+    """model.solve, with relaxed-solve diagnostics according to policy
+
+    A failed solve raises SolveFailed (a RuntimeWarning, like gpkit's own
+    failures) whose `report` holds the diagnosis unless policy is "never".
+    With "always", successful solutions carry it as sol["diagnostics"].
+    `solver` is a SolverConfig; gpkit's defaults when None.
+    """
+    if policy not in POLICIES:
+        raise ValueError("diagnostics policy must be one of %s" % (POLICIES,))
+    telemetry = telemetry or NULL
+    try:
+        with telemetry.phase("solve") as event:
+            sol = (solver or DEFAULT).solve(model, verbosity=verbosity)
+            event["iteration_seconds"] = iteration_times(model)
+    except SOLVE_ERRORS as e:
+        report = None
+        if policy != "never":
+            with telemetry.phase("diagnose") as event:
+                report = event["report"] = fallback_diagnose(model)
+        raise SolveFailed(str(e), report)
+    if policy == "always":
+        with telemetry.phase("diagnose") as event:
+            sol["diagnostics"] = event["report"] = fallback_diagnose(model)
+    return sol
+
+
+def fallback_diagnose(model):
+    """diagnose(model), or a report of why diagnosis failed
+
+    Diagnosis must not mask the solve it explains, so any error it raises
+    is recorded under "errors" instead.
+    """
+    try:
+        return diagnose(model)
+    except Exception as e:
+        return {"constraints": [], "constants": [],
+                "errors": ["diagnosis: %s: %s" % (type(e).__name__, e)]}
@@ -0,0 +1,114 @@
+"""Design-of-experiments runs fanned out over a process pool"""
+import multiprocessing
+import numpy as np
+from store import ResultStore
+
+# The Sweep built once by each worker process
+_SWEEP = None
+
+
+def _init_worker(build):
+    global _SWEEP
+    _SWEEP = build()
+
+
+def _solve_chunk(task):
+    "Solves one chunk of points inside a worker"
+    start, points = task
+    return start, _SWEEP.run(points)
+
+
+def chunks(points, chunksize):
+    "Splits point columns into (start index, columns) tasks"
+    n_points = len(next(iter(points.values()))) if points else 0
+    for start in range(0, n_points, chunksize):
+        yield start, dict((n, np.asarray(c)[start:start+chunksize])
+                          for n, c in points.items())
+
+
+class WorkerPool(object):
+    """Worker processes that each build a Sweep once and keep it
+
+    Successive `run` calls reuse the same workers, so the model is built
+    once per process for the whole session and each worker's Sweep keeps
+    its warm starts between calls. Close it (or use it in a with block)
+    when done.
+
+    Arguments
+    ---------
+    build : callable
+        Module-level function returning a Sweep, e.g. aircraft.build_sweep
+        (or a functools.partial of it); called once per worker
+    processes : int
+        Worker count, defaults to the number of cores
+    """
+    def __init__(self, build, processes=None):
+        self.build = build
+        self.processes = processes or multiprocessing.cpu_count()
+        self.pool = multiprocessing.Pool(self.processes, _init_worker,
+                                         (build,))
+
+    def run(self, points, chunksize=None, store=None):
+        """Solves design points on the workers, returning rows in input order
+
+        Arguments
+        ---------
+        points : dict
+            Parameter name -> equal-length arrays of values (see sweep.grid)
+        chunksize : int
+            Points per task; defaults to about four tasks per worker
+        store : ResultStore or str
+            If given, each chunk's rows are appended as soon as they
+            arrive; a path is opened as a ResultStore of the sweep's row
+            dtype
+        """
+        n_points = len(next(iter(points.values()))) if points else 0
+        if not chunksize:
+            chunksize = max(1, int(np.ceil(n_points/(4.0*self.processes))))
+        # imap yields in submission order, so rows come back aligned
+        parts = []
+        for _, part in self.pool.imap(_solve_chunk, chunks(points, chunksize)):
+            if isinstance(store, str):
+                store = ResultStore(store, part.dtype)
+            if store is not None:
+                store.append(part)
+            parts.append(part)
+        if not parts:
+            return self.build().run(points)
+        return np.concatenate(parts)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_doe(build, points, processes=None, chunksize=None, store=None):
+    """Solves design points in parallel, returning rows in input order
+
+    A one-off WorkerPool; keep a WorkerPool open instead when solving
+    several batches of points with the same model.
+
+    Arguments
+    ---------
+    build : callable
+        Module-level function returning a Sweep, e.g. aircraft.build_sweep
+        (or a functools.partial of it); called once per worker, so each
+        process assembles the model a single time and reuses it
+    points : dict
+        Parameter name -> equal-length arrays of values (see sweep.grid)
+    processes : int
+        Worker count, defaults to the number of cores
+    chunksize : int
+        Points per task; defaults to about four tasks per worker
+    store : ResultStore or str
+        If given, each chunk's rows are appended as soon as they arrive; a
+        path is opened as a ResultStore of the sweep's row dtype
+    """
+    with WorkerPool(build, processes) as pool:
+        return pool.run(points, chunksize, store)
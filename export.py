@@ -0,0 +1,109 @@
+"""Batch export of solved designs to OpenVSP inputs"""
+import os
+import hashlib
+import subprocess
+from multiprocessing.pool import ThreadPool
+from vsp import DesFile
+
+SCRIPT = """void main() {
+    ClearVSPModel();
+    ReadVSPFile("%(vsp3)s");
+    Update();
+    Print("Update .vsp3 file\\n",true);
+    ReadApplyDESFile("%(des)s");
+    Print("Apply .des file\\n",true);
+    Update();
+    WriteVSPFile("%(out)s", SET_ALL);
+}
+"""
+
+
+def design_values(row, ids):
+    "The .des inputDict of one result row; ids maps column -> parameter IDs"
+    values = {}
+    for column, keys in ids.items():
+        for key in keys:
+            values[key] = float(row[column])
+    return values
+
+
+def design_hash(values):
+    "Content address of a design's parameter values"
+    text = ";".join("%s=%r" % (k, values[k]) for k in sorted(values))
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def write_design(values, directory, template="design.des",
+                 vsp3="sketch.vsp3"):
+    """Writes design.des and reload.vspscript into directory
+
+    Returns the script path, or None if the directory already holds this
+    exact design.
+    """
+    script = os.path.join(directory, "reload.vspscript")
+    if os.path.exists(script):
+        return None
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    des = DesFile(template)
+    des.update(values)
+    des.save(os.path.join(directory, "design.des"))
+    with open(script + ".tmp", "w") as f:
+        f.write(SCRIPT % {"vsp3": os.path.abspath(vsp3),
+                          "des": os.path.abspath(os.path.join(directory,
+                                                              "design.des")),
+                          "out": os.path.abspath(os.path.join(directory,
+                                                              "design.vsp3"))})
+    # the script appears last, so a half-written design is redone next time
+    os.rename(script + ".tmp", script)
+    return script
+
+
+def _run(args):
+    command, script = args
+    directory = os.path.dirname(script)
+    done = os.path.join(directory, "done")
+    if os.path.exists(done):
+        return script, 0
+    argv = [a.format(script=script, directory=directory) for a in command]
+    with open(os.path.join(directory, "geometry.log"), "w") as log:
+        status = subprocess.call(argv, stdout=log, stderr=subprocess.STDOUT)
+    if status == 0:
+        open(done, "w").close()
+    return script, status
+
+
+def export(rows, ids, outdir="vsp_designs", template="design.des",
+           vsp3="sketch.vsp3", command=None, workers=4):
+    """Exports every feasible result row to a content-addressed directory
+
+    Each design goes to outdir/<hash of its parameter values>/, so designs
+    whose values have not changed since a previous export are skipped.
+    `command` optionally runs per design, e.g.
+    ["vspscript", "-script", "{script}"], on a pool of `workers` threads;
+    a design whose command already succeeded is not run again.
+
+    Returns (row index -> design directory, design directory -> command
+    exit status); the second is empty without a command.
+    """
+    directories = {}
+    scripts = []
+    for i, row in enumerate(rows):
+        if "feasible" in rows.dtype.names and not row["feasible"]:
+            continue
+        values = design_values(row, ids)
+        directory = os.path.join(outdir, design_hash(values))
+        directories[i] = directory
+        write_design(values, directory, template, vsp3)
+        scripts.append(os.path.join(directory, "reload.vspscript"))
+    statuses = {}
+    if command:
+        pool = ThreadPool(workers)
+        try:
+            for script, status in pool.imap_unordered(
+                    _run, [(command, s) for s in sorted(set(scripts))]):
+                statuses[os.path.dirname(script)] = status
+        finally:
+            pool.close()
+            pool.join()
+    return directories, statuses
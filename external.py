@@ -0,0 +1,148 @@
+"""Constraints backed by external (non-GP) codes"""
+import bisect
+import multiprocessing
+import numpy as np
+try:
+    from gpkit.exceptions import InvalidGPConstraint
+except ImportError:  # before gpkit 1.0 non-GP constraints raised TypeError
+    InvalidGPConstraint = TypeError
+
+
+class ExternalCall(object):
+    """Memoized, batched evaluation of an external scalar function
+
+    Arguments
+    ---------
+    f : callable
+        The external code, y = f(x). With vectorized=True it must accept an
+        array of operating points and return an array of results.
+    rtol : float
+        Results are reused for any x within this relative distance of an
+        already-evaluated point
+    vectorized : bool
+        Evaluate a batch of operating points in one call of f
+    processes : int
+        If nonzero, dispatch batches to a pool of this many processes
+        (f must then be a picklable module-level function)
+    """
+    def __init__(self, f, rtol=1e-6, vectorized=True, processes=0):
+        self.f = f
+        self.rtol = rtol
+        self.vectorized = vectorized
+        self.processes = processes
+        self.pool = None
+        self.xs = []  # evaluated points, kept sorted for bisection
+        self.ys = []
+        self.calls = 0
+        self.hits = 0
+
+    def lookup(self, x):
+        "The stored result within rtol of x, or None"
+        i = bisect.bisect_left(self.xs, x)
+        for j in (i - 1, i):
+            if 0 <= j < len(self.xs) and abs(self.xs[j] - x) <= self.rtol*abs(x):
+                return self.ys[j]
+        return None
+
+    def store(self, x, y):
+        i = bisect.bisect_left(self.xs, x)
+        self.xs.insert(i, x)
+        self.ys.insert(i, y)
+
+    def compute(self, xs):
+        "Runs the external code on every point of xs"
+        self.calls += len(xs)
+        if self.processes:
+            if self.pool is None:
+                self.pool = multiprocessing.Pool(self.processes)
+            return np.array(self.pool.map(self.f, list(xs)), dtype=float)
+        if self.vectorized:
+            return np.asarray(self.f(xs), dtype=float)
+        return np.array([self.f(x) for x in xs], dtype=float)
+
+    def evaluate(self, xs):
+        "Results at each operating point, only computing those not memoized"
+        xs = np.atleast_1d(np.asarray(xs, dtype=float))
+        out = np.empty(len(xs))
+        missing = []
+        for i, x in enumerate(xs):
+            y = self.lookup(x)
+            if y is None:
+                missing.append(i)
+            else:
+                out[i] = y
+                self.hits += 1
+        if missing:
+            new = np.unique(xs[missing])
+            for x, y in zip(new, self.compute(new)):
+                self.store(x, y)
+            for i in missing:
+                out[i] = self.lookup(xs[i])
+        return out
+
+    def __call__(self, x):
+        return float(self.evaluate([x])[0])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        "Shuts down the process pool, if one was started"
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+
+class ExternalConstraint(object):
+    """y >= f(x) for an external f, relinearized at every SP iteration
+
+    At each iteration f is evaluated at the current x and at a small step
+    beyond it (one batched call), and the constraint becomes the local
+    monomial fit y >= f(x0)*(x/x0)**k. x should be dimensionless.
+
+    The step must be well beyond the call's memo tolerance: a stepped
+    point within rtol of x0 would reuse f(x0) and give a zero slope.
+
+    It is a single constraint rather than a ConstraintSet, which gpkit
+    >= 1.0 would flatten away for having no children.
+    """
+    def __init__(self, x, y, call, guess, step=1e-3):
+        if step < 100*call.rtol:
+            raise ValueError("step %g must be at least 100 times the"
+                             " ExternalCall's rtol %g" % (step, call.rtol))
+        # what gpkit reads from every constraint in a set
+        self.vks = {x.key, y.key}
+        self.bounded = set()
+        self.meq_bounded = {}
+        self.x = x
+        self.y = y
+        self.call = call
+        self.guess = guess
+        self.step = step
+
+    # Prevents solving as a GP, thus forcing sequential iteration
+    def as_hmapslt1(self, substitutions):
+        raise InvalidGPConstraint("ExternalConstraint cannot solve as a GP.")
+
+    def as_posyslt1(self, substitutions=None):  # before gpkit 1.0
+        raise InvalidGPConstraint("ExternalConstraint cannot solve as a GP.")
+
+    def str_without(self, excluded=()):
+        return "%s >= external(%s)" % (self.y.key.str_without(excluded),
+                                       self.x.key.str_without(excluded))
+
+    def __str__(self):
+        return self.str_without()
+
+    def as_gpconstr(self, x0, substitutions=None):
+        "Monomial approximation of the external constraint about x0"
+        x_star = self.guess
+        if x0 and self.x.key in x0:
+            x_star = float(x0[self.x.key])
+        f0, f1 = self.call.evaluate([x_star, x_star*(1 + self.step)])
+        k = np.log(f1/f0)/np.log(1 + self.step)
+        return (self.y >= f0*(self.x/x_star)**k)
@@ -0,0 +1,97 @@
+"""Adaptive mapping of the feasible region of a Sweep's parameters"""
+from collections import namedtuple, OrderedDict
+import numpy as np
+from gpkit import Model
+from gpkit.constraints.relax import ConstraintsRelaxedEqually
+from sweep import Sweep, grid
+
+# grid: coarse Sweep rows; boundary: one row per bisected edge;
+# solves: total solves made; dense_solves: uniform grid of equal resolution
+FeasibilityMap = namedtuple("FeasibilityMap",
+                            "grid boundary solves dense_solves")
+
+
+def relaxed_sweep(sweep):
+    """A Sweep of the smallest equal relaxation making every constraint hold
+
+    Its "relaxation" output is 1 at feasible points and grows with how far
+    a point is from feasibility. As in diagnostics.diagnose, the original
+    cost is kept at a small weight, relaxvar**30 * cost, since the
+    relaxation alone leaves the design unbounded. Points that still fail
+    to solve come back with feasible=False (see Sweep.fill).
+    """
+    relaxed = ConstraintsRelaxedEqually(sweep.model)
+    model = Model(relaxed.relaxvar**30*sweep.model.cost, [relaxed])
+    return Sweep(model, {"relaxation": relaxed.relaxvar}, sweep.parameters,
+                 signomial=sweep.signomial, solver=sweep.solver)
+
+
+def boundary(sweep, ranges, coarse=3, depth=5, relax=True):
+    """Locates the feasibility boundary by bisection instead of a dense grid
+
+    Solves a coarse full-factorial grid over `ranges`, then bisects only the
+    grid edges whose ends differ in feasibility, `depth` times each, all
+    edges of a round solved in one batch. Relaxed-feasibility solves run
+    once per edge, at its infeasible end.
+
+    Arguments
+    ---------
+    sweep : Sweep
+        Its parameters name the axes, e.g. aircraft.build_sweep()
+    ranges : dict
+        Parameter name -> (low, high)
+    coarse : int
+        Grid points per axis
+    depth : int
+        Bisections per boundary edge
+
+    Returns a FeasibilityMap whose boundary array has, per edge, the
+    feasible end (parameter columns), the infeasible end ("<name>_out"),
+    the axis bisected and the relaxation needed at the infeasible end.
+    """
+    names = list(ranges)
+    d = len(names)
+    axes = [np.linspace(ranges[n][0], ranges[n][1], coarse) for n in names]
+    coarse_rows = sweep.run(grid(OrderedDict(zip(names, axes))))
+    feasible = coarse_rows["feasible"].reshape((coarse,)*d)
+    solves = len(coarse_rows)
+
+    inside, outside, edge_axis = [], [], []
+    for axis in range(d):
+        lower = np.take(feasible, range(coarse - 1), axis=axis)
+        upper = np.take(feasible, range(1, coarse), axis=axis)
+        for idx in np.argwhere(lower != upper):
+            a, b = list(idx), list(idx)
+            b[axis] += 1
+            pa = [axes[k][a[k]] for k in range(d)]
+            pb = [axes[k][b[k]] for k in range(d)]
+            ok = feasible[tuple(a)]
+            inside.append(pa if ok else pb)
+            outside.append(pb if ok else pa)
+            edge_axis.append(axis)
+    inside, outside = np.array(inside), np.array(outside)
+
+    for _ in range(depth if len(inside) else 0):
+        mid = (inside + outside)/2
+        rows = sweep.run(dict((n, mid[:, k]) for k, n in enumerate(names)))
+        solves += len(rows)
+        ok = rows["feasible"]
+        inside[ok] = mid[ok]
+        outside[~ok] = mid[~ok]
+
+    result = np.zeros(len(inside), dtype=[(str(n), float) for n in names]
+                      + [(str(n) + "_out", float) for n in names]
+                      + [("axis", int), ("relaxation", float)])
+    for k, n in enumerate(names):
+        result[str(n)] = inside[:, k] if len(inside) else []
+        result[str(n) + "_out"] = outside[:, k] if len(outside) else []
+    result["axis"] = edge_axis
+    result["relaxation"] = np.nan
+    if relax and len(outside):
+        rows = relaxed_sweep(sweep).run(
+            dict((n, outside[:, k]) for k, n in enumerate(names)))
+        solves += len(rows)
+        result["relaxation"] = rows["relaxation"]
+
+    dense = ((coarse - 1)*2**depth + 1)**d
+    return FeasibilityMap(coarse_rows, result, solves, dense)
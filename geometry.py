@@ -0,0 +1,185 @@
+"""Planform, wetted area and volume from .vsp3 cross-sections
+
+The .vsp3 file is parsed once; every quantity is then a NumPy expression
+over its sections, so thousands of scaled variants are evaluated at once
+without launching OpenVSP.
+"""
+import os
+from xml.etree.ElementTree import iterparse
+import numpy as np
+
+# XSecCurve type of a degenerate (point) cross-section
+POINT = 0
+
+_parsed = {}
+
+
+def _points(text):
+    "(x, y) pairs of an airfoil coordinate list stored as x, y, z triples"
+    values = np.array([float(v) for v in text.replace(',', ' ').split()])
+    return values.reshape(-1, 3)[:, :2]
+
+
+def _airfoil(upper, lower):
+    "Thickness/chord and area/chord**2 of an airfoil from its surfaces"
+    x = np.linspace(0, 1, 101)
+    yu = np.interp(x, upper[:, 0], upper[:, 1])
+    yl = np.interp(x, lower[:, 0], lower[:, 1])
+    thickness = np.maximum(yu - yl, 0)
+    area = ((thickness[1:] + thickness[:-1])/2*np.diff(x)).sum()
+    return thickness.max(), area
+
+
+def read_geometry(filename='sketch.vsp3'):
+    """Geom name -> {"type", "parms", "sections"} from a .vsp3 file
+
+    "parms" holds the geom's own parameters by tag (Length,
+    Sym_Planar_Flag, ...), "sections" one dict of parameters per
+    cross-section, in order. Results are reused until the file changes.
+    """
+    key = (os.path.abspath(filename), os.path.getmtime(filename))
+    if key in _parsed:
+        return _parsed[key]
+    geoms = {}
+    path = []
+    geom = section = None
+    upper = None
+    for event, elem in iterparse(filename, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == 'Geom' and path and path[-1] == 'Vehicle':
+                geom = {"type": None, "parms": {}, "sections": []}
+            elif elem.tag == 'XSec' and path and path[-1] == 'XSecSurf':
+                section = {}
+                geom["sections"].append(section)
+            path.append(elem.tag)
+            continue
+        path.pop()
+        if geom is None:
+            elem.clear()
+            continue
+        if elem.tag == 'Geom' and path and path[-1] == 'Vehicle':
+            geoms[geom.pop("name")] = geom
+            geom = None
+        elif elem.tag == 'XSec' and path and path[-1] == 'XSecSurf':
+            section = None
+        elif elem.tag == 'Name' and path[-2:] == ['Geom', 'ParmContainer']:
+            geom["name"] = elem.text
+        elif elem.tag == 'TypeName' and path[-1:] == ['GeomBase']:
+            geom["type"] = elem.text
+        elif elem.tag == 'Type' and section is not None \
+                and path[-2:] == ['XSecCurve', 'XSecCurve']:
+            section["curve"] = int(elem.text)
+        elif elem.tag == 'UpperPnts' and section is not None:
+            upper = _points(elem.text)
+        elif elem.tag == 'LowerPnts' and section is not None:
+            section["ThickChord"], section["AreaChord2"] = _airfoil(
+                upper, _points(elem.text))
+        elif 'Value' in elem.attrib and 'ID' in elem.attrib:
+            target = section if section is not None else geom["parms"]
+            # airfoil points, when present, override the nominal ThickChord
+            if not (elem.tag == 'ThickChord' and 'ThickChord' in target):
+                target[elem.tag] = float(elem.attrib['Value'])
+        elem.clear()
+    _parsed[key] = geoms
+    return geoms
+
+
+def _columns(*scales):
+    "Scales broadcast to one column of variants each"
+    return [np.asarray(s, dtype=float).reshape(-1, 1)
+            for s in np.broadcast_arrays(*[np.atleast_1d(s) for s in scales])]
+
+
+class WingGeometry(object):
+    """Trapezoidal wing sections of a Wing geom
+
+    OpenVSP's first wing section is a placeholder at the root and is
+    skipped. Mirrored geoms (Sym_Planar_Flag set) count both halves.
+    Wetted area is Raymer's S_wet = S (1.977 + 0.52 t/c) per section.
+    """
+    def __init__(self, geom):
+        sections = geom["sections"][1:]
+        get = lambda name, default=0.0: np.array(
+            [s.get(name, default) for s in sections])
+        self.span = get("Span")
+        self.root = get("Root_Chord")
+        self.tip = get("Tip_Chord")
+        self.tc = get("ThickChord", 0.12)
+        # NACA 4-digit sections enclose about 0.685 t c**2
+        self.area_coefficient = np.array(
+            [s.get("AreaChord2", 0.685*s.get("ThickChord", 0.12))
+             for s in sections])
+        self.halves = 2 if geom["parms"].get("Sym_Planar_Flag", 0) else 1
+
+    def evaluate(self, span_scale=1, chord_scale=1):
+        """S, b, A, S_wet, k_wet (S_wet/S) and V of every variant
+
+        Scales are scalars or equal-length arrays, applied to every
+        section; results are arrays with one entry per variant.
+        """
+        span_scale, chord_scale = _columns(span_scale, chord_scale)
+        span = span_scale*self.span
+        root = chord_scale*self.root
+        tip = chord_scale*self.tip
+        planform = span*(root + tip)/2
+        S = self.halves*planform.sum(axis=1)
+        b = self.halves*span.sum(axis=1)
+        S_wet = self.halves*(planform*(1.977 + 0.52*self.tc)).sum(axis=1)
+        V = self.halves*(self.area_coefficient*span
+                         * (root**2 + root*tip + tip**2)/3).sum(axis=1)
+        return {"S": S, "b": b, "A": b**2/S, "S_wet": S_wet,
+                "k_wet": S_wet/S, "V": V}
+
+
+class BodyGeometry(object):
+    """Elliptical stations along a Fuselage geom
+
+    Each station has a width and height (equal for circles, zero for
+    points) at a fraction of the body length. Between stations the body
+    is a linearly lofted frustum.
+    """
+    def __init__(self, geom):
+        sections = geom["sections"]
+        self.length = geom["parms"]["Length"]
+        self.x = np.array([s.get("XLocPercent", 0.0) for s in sections])
+        width, height = [], []
+        for s in sections:
+            if s.get("curve") == POINT:
+                w = h = 0.0
+            elif "Circle_Diameter" in s:
+                w = h = s["Circle_Diameter"]
+            else:
+                w, h = s.get("Width", 0.0), s.get("Height", 0.0)
+            width.append(w)
+            height.append(h)
+        self.width = np.array(width)
+        self.height = np.array(height)
+
+    def evaluate(self, length_scale=1, width_scale=1, height_scale=1):
+        "length, width, height, S_wet and V of every variant, as arrays"
+        length_scale, width_scale, height_scale = _columns(
+            length_scale, width_scale, height_scale)
+        x = length_scale*self.length*self.x
+        a = width_scale*self.width/2
+        b = height_scale*self.height/2
+        # Ramanujan's ellipse perimeter
+        perimeter = np.pi*(3*(a + b) - np.sqrt((3*a + b)*(a + 3*b)))
+        area = np.pi*a*b
+        dx = np.diff(x, axis=1)
+        dr = np.diff(perimeter, axis=1)/(2*np.pi)
+        slant = np.sqrt(dx**2 + dr**2)
+        S_wet = ((perimeter[:, 1:] + perimeter[:, :-1])/2*slant).sum(axis=1)
+        V = (dx*(area[:, 1:] + area[:, :-1]
+                 + np.sqrt(area[:, 1:]*area[:, :-1]))/3).sum(axis=1)
+        return {"length": x[:, -1] - x[:, 0], "width": 2*a.max(axis=1),
+                "height": 2*b.max(axis=1), "S_wet": S_wet, "V": V}
+
+
+def wing(name='WingGeom', filename='sketch.vsp3'):
+    "The WingGeometry of a named geom"
+    return WingGeometry(read_geometry(filename)[name])
+
+
+def body(name='FuselageGeom', filename='sketch.vsp3'):
+    "The BodyGeometry of a named geom"
+    return BodyGeometry(read_geometry(filename)[name])
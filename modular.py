@@ -75,8 +75,8 @@ class FlightSegment(Model):
 
 class Mission(Model):
     "A sequence of flight segments"
-    def setup(self, aircraft):
-        with Vectorize(4):  # four flight segments
+    def setup(self, aircraft, segments=4):
+        with Vectorize(segments):
             fs = FlightSegment(aircraft)
 
         Wburn = fs.ekranoplanp["W_{burn}"]
@@ -177,10 +177,11 @@ class PropellerP(Model):
         T = Variable("T","N","Thrust")
         return [T <= propeller["powerToThrust"]*state["engineShaftP"]]
 
-AC = Ekranoplan()
-MISSION = Mission(AC)
-objective = 1/MISSION.R
-M = Model(objective, [MISSION, AC])
-M.debug()
-SOL = M.solve(verbosity=0)
-print SOL.table()
\ No newline at end of file
+if __name__ == "__main__":
+    from diagnostics import solve
+    AC = Ekranoplan()
+    MISSION = Mission(AC)
+    objective = 1/MISSION.R
+    M = Model(objective, [MISSION, AC])
+    SOL = solve(M, "on-failure")
+    print(SOL.table())
@@ -0,0 +1,119 @@
+"""Monte Carlo propagation of uncertain fixed variables"""
+import numpy as np
+from doe import WorkerPool
+from store import ResultStore
+
+
+def sampler(spec):
+    """A function (rng, n) -> n positive samples, from a distribution spec
+
+    Specs are ("normal", mean, sd), ("lognormal", median, sigma of log),
+    ("uniform", low, high) or ("triangular", low, mode, high); a callable
+    taking (rng, n) is used as the draw. Fixed variables of a GP must be
+    positive, so non-positive draws are redrawn, truncating the
+    distribution at zero.
+    """
+    if callable(spec):
+        return positive(spec)
+    kind, args = spec[0], spec[1:]
+    if kind == "normal":
+        return positive(lambda rng, n: rng.normal(args[0], args[1], n))
+    if kind == "lognormal":
+        return lambda rng, n: args[0]*rng.lognormal(0, args[1], n)
+    if kind == "uniform":
+        return positive(lambda rng, n: rng.uniform(args[0], args[1], n))
+    if kind == "triangular":
+        return positive(lambda rng, n: rng.triangular(args[0], args[1],
+                                                      args[2], n))
+    raise ValueError("unknown distribution %r" % kind)
+
+
+def positive(draw, attempts=100):
+    "draw, with non-positive samples rejected and redrawn"
+    def truncated(rng, n):
+        values = np.asarray(draw(rng, n), dtype=float)
+        for _ in range(attempts):
+            bad = ~(values > 0)
+            if not bad.any():
+                return values
+            values[bad] = draw(rng, int(bad.sum()))
+        raise ValueError("distribution has almost no positive mass")
+    return truncated
+
+
+def percentiles(rows, outputs, q):
+    "Percentiles q of each output over the feasible rows"
+    ok = rows[rows["feasible"]]
+    return dict((name, np.percentile(ok[name], q) if len(ok)
+                 else np.full(len(q), np.nan))
+                for name in outputs)
+
+
+def monte_carlo(build, distributions, samples=1000, batch=100,
+                outputs=("range", "W"), q=(5, 50, 95), rtol=0.005,
+                processes=1, store=None, seed=None):
+    """Samples fixed variables, solves, and reports output percentiles
+
+    Samples are drawn and solved a batch at a time, locally or across
+    `processes` workers of one WorkerPool kept for the whole run, and
+    appended to `store` (a ResultStore or path) as each batch finishes.
+    Samples the solver fails on count as infeasible rows. Sampling stops
+    early once no percentile of any output moved by more than rtol
+    (relative) over the last batch.
+
+    Arguments
+    ---------
+    build : callable
+        Returns a Sweep, e.g. functools.partial(aircraft.build_sweep,
+        warm_start=True, cache=SolutionCache()); module-level when
+        processes > 1
+    distributions : dict
+        Parameter name -> distribution spec (see `sampler`)
+
+    Returns a dict of the samples solved, the feasible fraction, the final
+    percentiles of each output, their history after every batch and
+    whether the estimate converged.
+    """
+    rng = np.random.RandomState(seed)
+    draw = dict((name, sampler(spec)) for name, spec in distributions.items())
+    if processes > 1:
+        with WorkerPool(build, processes) as pool:
+            return _sample(pool.run, draw, rng, samples, batch, outputs, q,
+                           rtol, store)
+    sweep = build()
+
+    def run(points, store=None):
+        rows = sweep.run(points)
+        if isinstance(store, str):
+            store = ResultStore(store, rows.dtype)
+        if store is not None:
+            store.append(rows)
+        return rows
+    return _sample(run, draw, rng, samples, batch, outputs, q, rtol, store)
+
+
+def _sample(run, draw, rng, samples, batch, outputs, q, rtol, store):
+    "The batch loop of monte_carlo, solving points with run(points, store=)"
+    history = []
+    parts = []
+    solved = 0
+    converged = False
+    while solved < samples:
+        n = min(batch, samples - solved)
+        points = dict((name, f(rng, n)) for name, f in draw.items())
+        rows = run(points, store=store)
+        parts.append(rows)
+        solved += n
+        history.append(percentiles(np.concatenate(parts), outputs, q))
+        if len(history) > 1:
+            change = max(np.nanmax(np.abs(history[-1][k]/history[-2][k] - 1))
+                         for k in outputs)
+            if change < rtol:
+                converged = True
+                break
+    rows = np.concatenate(parts)
+    return {"samples": solved,
+            "feasible_fraction": float(np.mean(rows["feasible"])),
+            "percentiles": history[-1],
+            "history": history,
+            "converged": converged}
@@ -0,0 +1,121 @@
+"""Pareto fronts between two sweep outputs by the epsilon-constraint method"""
+from functools import partial
+import numpy as np
+from gpkit import Model, Variable
+from sweep import Sweep
+from doe import WorkerPool
+
+
+def epsilon_sweep(sweep, objective, bound, start, maximize=True):
+    """A Sweep optimizing one output subject to another output <= epsilon
+
+    `objective` and `bound` name outputs of `sweep`; epsilon is swept as the
+    parameter "epsilon", in the units of the bounded output.
+    """
+    obj = sweep.outputs[objective]
+    limit = sweep.outputs[bound]
+    units = limit.key.units  # a pint Quantity, or None if dimensionless
+    eps = Variable("\\epsilon", start, str(units.units) if units else "-",
+                   "Pareto bound on " + bound)
+    model = Model(1/obj if maximize else obj, [sweep.model, limit <= eps])
+    parameters = dict(sweep.parameters)
+    parameters["epsilon"] = eps
+    return Sweep(model, sweep.outputs, parameters,
+                 warm_start=sweep.warm_start, signomial=sweep.signomial,
+                 solver=sweep.solver)
+
+
+def _build_epsilon(build, objective, bound, start, maximize):
+    "Worker builder for parallel fronts; build must be module-level"
+    return epsilon_sweep(build(), objective, bound, start, maximize)
+
+
+def anchors(sweep, objective, bound, maximize=True):
+    """Range of the bound over the front
+
+    The upper end is the bound's value at the unconstrained optimum of the
+    objective. The lower end is the bound's own minimum, found with the
+    objective as a slight tie-breaker (limit * obj**-1e-3 when maximizing)
+    since the bound alone leaves the rest of the design unbounded.
+    """
+    obj = sweep.outputs[objective]
+    limit = sweep.outputs[bound]
+    tiebreak = -1e-3 if maximize else 1e-3
+    ends = []
+    for cost in (limit*obj**tiebreak, obj**(-1 if maximize else 1)):
+        sol = sweep.solver.solve(Model(cost, [sweep.model]), sweep.signomial)
+        ends.append(float(getattr(sol(limit), "magnitude", sol(limit))))
+    return tuple(ends)
+
+
+def bends(x, y):
+    """Refinement priority of each interval of a sorted front
+
+    The interval's length times the mean turning angle at its ends, in
+    coordinates normalized to the front's extent; straight stretches
+    score zero.
+    """
+    span = lambda v: np.ptp(v) or 1.0
+    p = np.column_stack([(x - x.min())/span(x), (y - y.min())/span(y)])
+    d = np.diff(p, axis=0)
+    length = np.hypot(d[:, 0], d[:, 1])
+    heading = np.arctan2(d[:, 1], d[:, 0])
+    turn = np.zeros(len(p))
+    turn[1:-1] = np.abs(np.diff(heading))
+    return length*(turn[:-1] + turn[1:])/2
+
+
+def front(build, objective="range", bound="W", maximize=True, points=9,
+          max_points=40, tol=0.01, processes=1):
+    """Traces the trade between two outputs of a Sweep
+
+    Starts from `points` evenly spaced bounds between the anchors, then
+    repeatedly bisects the intervals where the front bends most (priority
+    above `tol`) until it is straight enough or `max_points` are solved.
+    Neighbouring points warm-start each other when the builder's Sweep
+    has warm_start=True.
+
+    Arguments
+    ---------
+    build : callable
+        Returns a Sweep, e.g. aircraft.build_sweep; must be module-level
+        (or a functools.partial of one) when processes > 1
+    objective, bound : str
+        Output names: `objective` is optimized with `bound` <= epsilon
+    maximize : bool
+        Maximize the objective (e.g. range) rather than minimize it
+    processes : int
+        Solve each round of points in parallel with run_doe
+
+    Returns the Sweep result rows of the feasible front, sorted by
+    epsilon, with every output column of each point.
+    """
+    base = build()
+    low, high = anchors(base, objective, bound, maximize)
+    if processes > 1:
+        # one pool for every round, so workers keep their warm starts
+        builder = partial(_build_epsilon, build, objective, bound, high,
+                          maximize)
+        with WorkerPool(builder, processes) as pool:
+            return _trace(lambda eps: pool.run({"epsilon": eps}), low, high,
+                          objective, bound, points, max_points, tol)
+    sweep = epsilon_sweep(base, objective, bound, high, maximize)
+    return _trace(lambda eps: sweep.run({"epsilon": eps}), low, high,
+                  objective, bound, points, max_points, tol)
+
+
+def _trace(solve, low, high, objective, bound, points, max_points, tol):
+    "The refinement loop of front, solving epsilon arrays with solve"
+    result = solve(np.linspace(low, high, points))
+    while len(result) < max_points:
+        ok = np.sort(result[result["feasible"]], order="epsilon")
+        if len(ok) < 3:
+            break
+        priority = bends(ok[bound], ok[objective])
+        worst = np.argsort(-priority)[:max_points - len(result)]
+        worst = worst[priority[worst] > tol]
+        if not len(worst):
+            break
+        eps = (ok["epsilon"][worst] + ok["epsilon"][worst + 1])/2
+        result = np.concatenate([result, solve(eps)])
+    return np.sort(result[result["feasible"]], order="epsilon")
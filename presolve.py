@@ -0,0 +1,211 @@
+"""Presolve: fold fixed variables, prune redundant constraints, lint variables"""
+import warnings
+import numpy as np
+from gpkit import Model, Signomial
+from diagnostics import flat_constraints
+
+try:
+    from gpkit.exceptions import InvalidGPConstraint
+except ImportError:
+    InvalidGPConstraint = TypeError
+
+
+class PresolveWarning(UserWarning):
+    "A suspicious variable declaration found by presolve"
+
+
+def magnitude(value):
+    return getattr(value, "magnitude", value)
+
+
+def posynomials(constraint, substitutions):
+    """The constraint as posynomials p <= 1 with fixed values substituted
+
+    Raises InvalidGPConstraint for a signomial constraint.
+    """
+    if hasattr(constraint, "as_posyslt1"):
+        return constraint.as_posyslt1(substitutions)
+    # gpkit >= 1.0 gives the posynomials' maps of exponent -> coefficient
+    return [Signomial(hmap) for hmap in constraint.as_hmapslt1(substitutions)]
+
+
+def _terms(posy):
+    "exponent -> coefficient of a (dimensionless) posynomial"
+    return dict((exp, float(magnitude(c)))
+                for exp, c in zip(posy.exps, np.atleast_1d(posy.cs)))
+
+
+def dominated(p, q):
+    "Whether posynomial p <= q everywhere, so q <= 1 implies p <= 1"
+    return all(exp in q and c <= q[exp] for exp, c in p.items())
+
+
+def declared(model):
+    """Keys of the variables declared by a model and all of its submodels
+
+    For modular models, whose Variables are made inside each setup; note
+    that gpkit has already merged a name declared twice in one setup.
+    """
+    keys = set()
+    stack = [model]
+    while stack:
+        item = stack.pop()
+        keys.update(getattr(item, "unique_varkeys", ()))
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return sorted(keys, key=str)
+
+
+def duplicates(model, declared=()):
+    """Names declared more than once, as (name, [descriptions]) pairs
+
+    Variables sharing a name and lineage are one variable to gpkit, so a
+    second declaration silently aliases the first (e.g. a "P" bound
+    declared as Variable('P', 26099) fixes the cruise power "P" too).
+    `declared` lists the Variable objects a build function created (or
+    their keys).
+    """
+    seen = {}
+    for var in declared:
+        key = getattr(var, "key", var)
+        descr = (key.descr.get("label"), key.descr.get("value"),
+                 str(key.descr.get("units")))
+        seen.setdefault(str(key), set()).add(descr)
+    return sorted((name, sorted(descrs, key=str))
+                  for name, descrs in seen.items() if len(descrs) > 1)
+
+
+def unused(model, declared=()):
+    "Declared or fixed variables that appear in no constraint, by name"
+    # gpkit >= 1.0's model.varkeys lists every declared variable, used or not
+    used = set()
+    for constraint in flat_constraints(model):
+        used.update(getattr(constraint, "vks", None)
+                    or getattr(constraint, "varkeys", ()))
+    if hasattr(model, "cost"):
+        used.update(model.cost.varkeys)
+    # a vector variable is used when any of its elements is
+    used.update([key.veckey for key in used
+                 if getattr(key, "veckey", None) is not None])
+    candidates = set(getattr(var, "key", var) for var in declared)
+    candidates.update(getattr(model, "unique_varkeys", ()))
+    candidates.update(model.substitutions)
+    # an unused vector is reported once, not element by element
+    candidates = set(getattr(key, "veckey", None) or key for key in candidates)
+    return sorted(str(key) for key in candidates if key not in used)
+
+
+def near_zero(substitutions, tiny=1e-6):
+    """Dimensionless fixed variables whose values are all below tiny
+
+    Values with units are skipped: their magnitude depends on the units
+    they are given in, e.g. a real BSFC is 1.4e-7 kg/s/W.
+    """
+    return sorted(str(key) for key, value in substitutions.items()
+                  if getattr(key, "units", None) is None
+                  and np.all(np.abs(magnitude(value)) < tiny))
+
+
+def presolve(model, declared=(), tiny=1e-6, verbosity=0):
+    """A smaller model equivalent to `model`, and a report of what changed
+
+    Fixed variables are folded into the coefficients of every GP-compatible
+    constraint (as gpkit does when compiling), after which a constraint
+    whose every term is matched by an equal-or-larger term of another is
+    dropped as dominated, and one with no free variable left is dropped
+    once checked to hold. Signomial constraints are kept as they are.
+
+    Duplicate and unused variables (see `duplicates` and `unused`) and
+    dimensionless fixed values below `tiny` (see `near_zero`) raise a
+    PresolveWarning. Returns (model, report); the report counts
+    constraints, monomials and free variables before and after, which
+    verbosity > 0 also prints.
+
+    Fixed variables are gone from the reduced model, so read them from the
+    original, and expect no sensitivities to them from its solution.
+    """
+    substitutions = model.substitutions
+    signomial, constant, posys = [], [], []
+    for constraint in flat_constraints(model):
+        try:
+            posys.extend((constraint, p) for p in
+                         posynomials(constraint, substitutions))
+        except InvalidGPConstraint:
+            signomial.append(constraint)
+    terms = [_terms(p) for _, p in posys]
+    for i, (constraint, posy) in enumerate(posys):
+        if all(not exp for exp in terms[i]):
+            if sum(terms[i].values()) > 1 + 1e-9:
+                raise ValueError("constraint %s cannot hold with its fixed"
+                                 " values" % constraint)
+            constant.append(str(constraint))
+    pruned = set(i for i in range(len(posys))
+                 if all(not exp for exp in terms[i]))
+    # a dominating constraint shares every exponent, in particular the first
+    containing = {}
+    for j, t in enumerate(terms):
+        for exp in t:
+            containing.setdefault(exp, []).append(j)
+    dominated_by = {}
+    for i in range(len(posys)):
+        if i in pruned:
+            continue
+        for j in containing[next(iter(terms[i]))]:
+            # of two identical constraints the later one goes
+            if j == i or j in pruned or (terms[j] == terms[i] and j > i):
+                continue
+            if dominated(terms[i], terms[j]):
+                pruned.add(i)
+                dominated_by[str(posys[i][0])] = str(posys[j][0])
+                break
+    kept = [posy <= 1 for i, (_, posy) in enumerate(posys) if i not in pruned]
+    cost = model.cost.sub(substitutions)
+    reduced = Model(cost, kept + signomial)
+    for key in reduced.varkeys:
+        if key in substitutions:
+            reduced.substitutions[key] = substitutions[key]
+
+    report = {"duplicates": duplicates(model, declared),
+              "unused": unused(model, declared),
+              "tiny": near_zero(substitutions, tiny),
+              "constant_only": constant,
+              "dominated": dominated_by,
+              "before": size(model),
+              "after": size(reduced)}
+    for name, descrs in report["duplicates"]:
+        warnings.warn("variable %s is declared %d ways: %s"
+                      % (name, len(descrs), descrs), PresolveWarning)
+    if report["unused"]:
+        warnings.warn("unused variables: %s" % ", ".join(report["unused"]),
+                      PresolveWarning)
+    if report["tiny"]:
+        warnings.warn("near-zero fixed values (placeholders?): %s"
+                      % ", ".join(report["tiny"]), PresolveWarning)
+    if verbosity:
+        print(summary(report))
+    return reduced, report
+
+
+def size(model):
+    "Constraint, monomial and free-variable counts of a model"
+    constraints = monomials = 0
+    for constraint in flat_constraints(model):
+        try:
+            posys = posynomials(constraint, model.substitutions)
+        except InvalidGPConstraint:
+            # a signomial constraint, left >= right or left <= right
+            posys = [constraint.left - constraint.right]
+        constraints += len(posys)
+        monomials += sum(len(p.exps) for p in posys)
+    free = [key for key in model.varkeys if key not in model.substitutions]
+    return {"constraints": constraints, "monomials": monomials,
+            "free variables": len(free)}
+
+
+def summary(report):
+    "One line per size measure, before -> after"
+    return "\n".join("%-15s %5d -> %5d" % (name, report["before"][name],
+                                           report["after"][name])
+                     for name in sorted(report["before"]))
@@ -0,0 +1,97 @@
+"""First-order prediction from solution sensitivities, re-solving when needed"""
+import csv
+import numpy as np
+
+
+def sensitivity_table(sol):
+    """(name, value, units, sensitivity) of every fixed variable
+
+    Sensitivities are d log(cost)/d log(value), sorted largest first.
+    """
+    rows = []
+    sens = sol["sensitivities"]["constants"]
+    # gpkit >= 1.0 also lists free variables' sensitivities here
+    for key, value in sol["constants"].items():
+        s = sens.get(key, 0)
+        units = getattr(key, "units", None)
+        rows.append((str(key), np.mean(getattr(value, "magnitude", value)),
+                     "-" if units is None else str(units), np.sum(s)))
+    return sorted(rows, key=lambda row: -abs(row[3]))
+
+
+def export_sensitivities(sol, path):
+    "Writes the sensitivity table to a CSV file"
+    with open(path, "w") as f:
+        writer = csv.writer(f)
+        writer.writerow(["variable", "value", "units", "sensitivity"])
+        writer.writerows(sensitivity_table(sol))
+
+
+class Predictor(object):
+    """Predicts the cost of nearby design points from one solve
+
+    With log sensitivities s_k at a base point, changing fixed variables
+    from x_k to x_k' gives log(cost') ~ log(cost) + sum s_k log(x_k'/x_k).
+    When the predicted change in log cost exceeds `threshold`, the point is
+    solved instead and becomes the new base, so predictions stay local.
+
+    Arguments
+    ---------
+    sweep : Sweep
+        Solves the model at given substitutions; its parameter names may be
+        used as keys of the changes passed to predict
+    threshold : float
+        Largest |change in log cost| answered by prediction
+    """
+    def __init__(self, sweep, threshold=0.05):
+        self.sweep = sweep
+        self.threshold = threshold
+        self.solves = 0
+        self.predictions = 0
+        self.rebase({})
+
+    def rebase(self, substitutions):
+        "Solves at substitutions and makes that the base point"
+        self.sol, _ = self.sweep.solve(substitutions)
+        self.solves += 1
+        self.base = dict(substitutions)
+
+    def default(self, key):
+        "A fixed variable's value in the model itself"
+        value = self.sweep.model.substitutions[key]
+        return getattr(value, "magnitude", value)
+
+    def point(self, values):
+        "values keyed by variable, so names and variables can be mixed"
+        return dict((self.sweep.key(k), v) for k, v in values.items())
+
+    def change(self, values):
+        """Predicted change in log cost from the base point
+
+        Variables the base point set but `values` doesn't are taken back
+        to their defaults.
+        """
+        values = self.point(values)
+        sens = self.sol["sensitivities"]["constants"]
+        change = 0
+        for key in set(values) | set(self.base):
+            new = values[key] if key in values else self.default(key)
+            old = self.base[key] if key in self.base else self.default(key)
+            change += np.sum(sens[key]*np.log(np.asarray(new, dtype=float)
+                                              / np.asarray(old, dtype=float)))
+        return change
+
+    def predict(self, values, resolve=True):
+        """Cost with fixed variables set to `values` (name or variable -> value)
+
+        Unlisted variables take the model's defaults, whichever point the
+        prediction is made from, so answers don't depend on query order.
+        Both aircraft models minimize 1/range, so the predicted range is
+        1/predict(values).
+        """
+        dlogcost = self.change(values)
+        if resolve and abs(dlogcost) > self.threshold:
+            self.rebase(self.point(values))
+            return self.sol["cost"]
+        self.predictions += 1
+        return self.sol["cost"]*np.exp(dlogcost)
@@ -0,0 +1,133 @@
+"""Solver backend selection, tolerances and iteration limits"""
+import os
+import warnings
+from contextlib import contextmanager
+
+try:
+    from gpkit.exceptions import Infeasible, UnknownInfeasible, UnboundedGP
+except ImportError:  # before gpkit 1.0 every failed solve is a RuntimeWarning
+    Infeasible = UnknownInfeasible = UnboundedGP = RuntimeWarning
+
+# gpkit 1.x names; its python mosek interface is "mosek_conif"
+BACKENDS = ("cvxopt", "mosek_conif", "mosek_cli")
+
+
+def _importable(name):
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def _executable(name):
+    return any(os.access(os.path.join(path, name), os.X_OK)
+               for path in os.environ.get("PATH", "").split(os.pathsep))
+
+
+def available():
+    "Installed GP solver backends, in order of preference"
+    found = []
+    if _importable("mosek"):
+        found.append("mosek_conif")
+    if _executable("mskexpopt"):
+        found.append("mosek_cli")
+    if _importable("cvxopt"):
+        found.append("cvxopt")
+    return found
+
+
+def default_backend():
+    "The backend gpkit solves with when none is named"
+    from gpkit import settings
+    return settings.get("default_solver")
+
+
+class SolverConfig(object):
+    """How a model is solved: backend, tolerances and iteration limits
+
+    Arguments
+    ---------
+    solver : str
+        One of BACKENDS; None uses gpkit's default
+    reltol, abstol, feastol : float
+        Interior-point tolerances (cvxopt's defaults are 1e-6, 1e-7, 1e-7);
+        sweeps content with 1e-4 relative accuracy can loosen reltol.
+        cvxopt only: gpkit has no way to pass them to mosek, so they raise
+        a ValueError with a mosek backend and a warning when gpkit's
+        default backend isn't cvxopt
+    maxiters : int
+        Interior-point iteration limit, cvxopt only like the tolerances
+    sp_reltol : float
+        Convergence tolerance of sequential GP (signomial) solves
+    sp_iteration_limit : int
+        Most GPs solved by one signomial solve
+    options : dict
+        Extra keyword arguments passed to the backend through model.solve
+    """
+    def __init__(self, solver=None, reltol=None, abstol=None, feastol=None,
+                 maxiters=None, sp_reltol=1e-4, sp_iteration_limit=50,
+                 **options):
+        if solver is not None and solver not in BACKENDS:
+            raise ValueError("unknown solver %r, expected one of %s"
+                             % (solver, BACKENDS))
+        self.solver = solver
+        self.tolerances = dict((k, v) for k, v in
+                               (("reltol", reltol), ("abstol", abstol),
+                                ("feastol", feastol), ("maxiters", maxiters))
+                               if v is not None)
+        if self.tolerances and solver not in (None, "cvxopt"):
+            raise ValueError("%s can't be applied to %s, only to cvxopt"
+                             % (", ".join(sorted(self.tolerances)), solver))
+        self.sp_reltol = sp_reltol
+        self.sp_iteration_limit = sp_iteration_limit
+        self.options = options
+
+    def signature(self):
+        "Every setting that can change a solution, as a stable string"
+        return repr((self.solver, sorted(self.tolerances.items()),
+                     self.sp_reltol, self.sp_iteration_limit,
+                     sorted((k, repr(v)) for k, v in self.options.items())))
+
+    @contextmanager
+    def applied(self):
+        "Sets the interior-point tolerances for the duration of a solve"
+        if not self.tolerances:
+            yield
+            return
+        if self.solver is None and default_backend() != "cvxopt":
+            warnings.warn("%s ignored: gpkit's default solver is %s, and they"
+                          " only apply to cvxopt"
+                          % (", ".join(sorted(self.tolerances)),
+                             default_backend()))
+            yield
+            return
+        from cvxopt import solvers
+        old = dict(solvers.options)
+        solvers.options.update(self.tolerances)
+        try:
+            yield
+        finally:
+            solvers.options.clear()
+            solvers.options.update(old)
+
+    def solve(self, model, signomial=False, verbosity=0, **kwargs):
+        "Solves model as a GP, or sequentially when signomial"
+        kwargs.update(self.options)
+        with self.applied():
+            if signomial:
+                return model.localsolve(
+                    solver=self.solver, verbosity=verbosity,
+                    reltol=self.sp_reltol,
+                    iteration_limit=self.sp_iteration_limit, **kwargs)
+            return model.solve(solver=self.solver, verbosity=verbosity,
+                               **kwargs)
+
+
+# What a solve raises for a design point that has no optimum. Anything else,
+# e.g. an unknown backend or a mis-shaped substitution, is a bug and raises
+SOLVE_ERRORS = (Infeasible, UnknownInfeasible, UnboundedGP)
+
+
+# gpkit's default backend and tolerances
+DEFAULT = SolverConfig()
@@ -0,0 +1,75 @@
+"""Append-only columnar result files, opened as memory maps"""
+import os
+import json
+import numpy as np
+
+MAGIC = b"EKRSTORE"
+HEADER_SIZE = 4096  # bytes, including MAGIC; records start after it
+
+
+class ResultStore(object):
+    """A file of fixed-size structured records behind a variable-name header
+
+    The header holds the record dtype as JSON (field names, types and
+    shapes, so per-segment vectors are single fields); records follow
+    back to back. Appending only writes new records, and `open_store`
+    maps the file without loading it.
+
+    Arguments
+    ---------
+    path : str
+        The store file
+    dtype : numpy dtype
+        Record layout; required when creating, read from the header
+        when the file exists
+    """
+    def __init__(self, path, dtype=None):
+        self.path = path
+        if os.path.exists(path):
+            self.dtype = read_header(path)
+            if dtype is not None and np.dtype(dtype) != self.dtype:
+                raise ValueError("%s holds records of a different dtype" % path)
+        elif dtype is None:
+            raise ValueError("a dtype is needed to create %s" % path)
+        else:
+            self.dtype = np.dtype(dtype)
+            header = json.dumps(self.dtype.descr).encode("utf-8")
+            if len(MAGIC) + len(header) > HEADER_SIZE:
+                raise ValueError("too many columns for the store header")
+            with open(path, "wb") as f:
+                f.write(MAGIC + header.ljust(HEADER_SIZE - len(MAGIC)))
+
+    def append(self, rows):
+        "Writes records (a structured array of the store's dtype) to the end"
+        rows = np.asarray(rows, dtype=self.dtype)
+        with open(self.path, "ab") as f:
+            f.write(rows.tobytes())
+
+    def __len__(self):
+        return (os.path.getsize(self.path) - HEADER_SIZE)//self.dtype.itemsize
+
+    def open(self):
+        return open_store(self.path)
+
+
+def read_header(path):
+    "The record dtype of a store file"
+    with open(path, "rb") as f:
+        head = f.read(HEADER_SIZE)
+    if not head.startswith(MAGIC):
+        raise ValueError("%s is not a result store" % path)
+    descr = json.loads(head[len(MAGIC):].decode("utf-8").rstrip())
+    return np.dtype([tuple([str(field[0]), str(field[1])]
+                           + [tuple(s) for s in field[2:]])
+                     for field in descr])
+
+
+def open_store(path, mode="r"):
+    "Memory-maps every complete record of a store as a structured array"
+    dtype = read_header(path)
+    count = (os.path.getsize(path) - HEADER_SIZE)//dtype.itemsize
+    if not count:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, offset=HEADER_SIZE,
+                     shape=(count,))
+
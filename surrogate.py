@@ -0,0 +1,138 @@
+"""Surrogates for expensive external evaluations, trained on recorded samples"""
+import os
+import numpy as np
+
+
+class Surrogate(object):
+    """Serves y = f(x) from a fit to recorded samples where it can be trusted
+
+    Every real evaluation is appended to a CSV file so later sessions start
+    with the samples already taken. A query is answered by the fit when it
+    lies inside the sampled range of every input and the fit's local error
+    estimate is within rtol; otherwise f is called and the fit is updated.
+    Each sample's leave-one-out relative error is kept, and a query's local
+    error is the largest among its d + 1 nearest samples (in log space), so
+    one poorly fit region doesn't stop the fit serving the rest.
+
+    Arguments
+    ---------
+    f : callable
+        The expensive code. Takes an array of points, shape (n,) for one
+        input or (n, d) for d inputs, and returns n outputs.
+    path : str
+        CSV file of samples, one `x_1,...,x_d,y` row each; None keeps
+        samples in memory only
+    rtol : float
+        Largest local relative error estimate served from the fit
+    kind : str
+        "monomial" fits log y linearly in log x, a GP-compatible form;
+        "interp" interpolates log y piecewise-linearly (one input only)
+    min_samples : int
+        Samples needed before the fit is used
+    """
+    def __init__(self, f, path=None, rtol=0.01, kind="monomial",
+                 min_samples=4):
+        if kind not in ("monomial", "interp"):
+            raise ValueError("unknown surrogate kind %r" % kind)
+        self.f = f
+        self.path = path
+        self.rtol = rtol
+        self.kind = kind
+        self.min_samples = min_samples
+        self.X = np.empty((0, 0))
+        self.Y = np.empty(0)
+        self.coeffs = None
+        self.local = np.empty(0)  # leave-one-out error at each sample
+        self.error = np.inf
+        self.calls = 0
+        self.served = 0
+        if path and os.path.exists(path):
+            data = np.loadtxt(path, delimiter=",", ndmin=2)
+            if data.size:
+                self.X, self.Y = data[:, :-1], data[:, -1]
+                self.fit()
+
+    def record(self, X, Y):
+        "Adds samples in memory and on disk"
+        self.X = np.vstack([self.X, X]) if self.X.size else X
+        self.Y = np.concatenate([self.Y, Y])
+        if self.path:
+            with open(self.path, "a") as f:
+                np.savetxt(f, np.column_stack([X, Y]), delimiter=",")
+
+    def fit(self):
+        "Refits to all samples and updates the local error estimates"
+        if len(self.Y) < self.min_samples:
+            self.coeffs, self.local, self.error = None, np.empty(0), np.inf
+            return
+        logX, logY = np.log(self.X), np.log(self.Y)
+        if self.kind == "monomial":
+            A = np.column_stack([np.ones(len(logY)), logX])
+            self.coeffs = np.linalg.lstsq(A, logY, rcond=-1)[0]
+            # leave-one-out residuals from the hat matrix diagonal
+            hat = np.einsum("ij,ji->i", A, np.linalg.pinv(A))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                residual = (A.dot(self.coeffs) - logY)/(1 - hat)
+            residual[~np.isfinite(residual)] = np.inf
+        else:
+            order = np.argsort(logX[:, 0])
+            self.coeffs = (logX[order, 0], logY[order])
+            x, y = self.coeffs
+            residual = np.empty(len(x))
+            residual[order] = [_loo(x, y, i) - y[i] for i in range(len(x))]
+        self.local = np.abs(np.expm1(residual))
+        self.error = np.max(self.local)
+
+    def predict(self, X):
+        "The fit's outputs at points X, shape (n, d)"
+        logX = np.log(X)
+        if self.kind == "monomial":
+            return np.exp(self.coeffs[0] + logX.dot(self.coeffs[1:]))
+        return np.exp(np.interp(logX[:, 0], *self.coeffs))
+
+    def local_error(self, X):
+        "Largest leave-one-out error among the d + 1 samples nearest each X"
+        logX, samples = np.log(X), np.log(self.X)
+        span = np.ptp(samples, axis=0)
+        scale = np.where(span > 0, span, 1)
+        dist = (((logX[:, None, :] - samples[None, :, :])/scale)**2).sum(-1)
+        k = min(samples.shape[1] + 1, len(samples))
+        nearest = np.argsort(dist, axis=1)[:, :k]
+        return self.local[nearest].max(axis=1)
+
+    def trusted(self, X):
+        "Which points of X the fit may answer"
+        if self.coeffs is None or not len(X):
+            return np.zeros(len(X), dtype=bool)
+        low, high = self.X.min(axis=0), self.X.max(axis=0)
+        inside = np.all((X >= low) & (X <= high), axis=1)
+        inside[inside] = self.local_error(X[inside]) <= self.rtol
+        return inside
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        X = x.reshape(len(np.atleast_1d(x)), -1)
+        out = np.empty(len(X))
+        mask = self.trusted(X)
+        if mask.any():
+            out[mask] = self.predict(X[mask])
+            self.served += int(mask.sum())
+        if not mask.all():
+            query = np.atleast_1d(x)[~mask]
+            Y = np.asarray(self.f(query), dtype=float).reshape(-1)
+            self.calls += len(Y)
+            out[~mask] = Y
+            self.record(X[~mask], Y)
+            self.fit()
+        return out if np.ndim(x) else out[0]
+
+
+def _loo(x, y, i):
+    """Sample i of sorted (x, y) predicted without it, interpolating
+    between its neighbours or extrapolating the two beyond an end one"""
+    if 0 < i < len(x) - 1:
+        return np.interp(x[i], np.delete(x, i), np.delete(y, i))
+    j, k = (1, 2) if i == 0 else (-2, -3)
+    if x[j] == x[k]:
+        return y[j]
+    return y[j] + (y[j] - y[k])*(x[i] - x[j])/(x[j] - x[k])
@@ -0,0 +1,204 @@
+"""Batched parameter sweeps over a built model"""
+from time import time
+import numpy as np
+from cache import model_key, rekeyed, structure_key
+from telemetry import NULL, iteration_times
+from solvers import DEFAULT, SOLVE_ERRORS
+
+
+class Sweep(object):
+    """Solves one built model at many design points
+
+    The constraint set is assembled once; each point only swaps the values
+    of fixed variables in `model.substitutions` before re-solving.
+
+    Arguments
+    ---------
+    model : gpkit Model
+        The built model, e.g. Model(1/MISSION.range, [MISSION, AC])
+    outputs : dict
+        Column name -> variable (or vector variable) to read from each
+        solution
+    parameters : dict
+        Column name -> fixed variable, so points can be given by name
+    warm_start : bool
+        Seed each signomial solve from the nearest already-solved point. A
+        no-op for GPs, the shipped aircraft model included: the interior
+        point solver takes no starting point.
+    signomial : bool
+        Solve with localsolve; detected from the model when None
+    cache : SolutionCache
+        Returns stored solutions for points that were solved before
+    telemetry : Telemetry
+        Receives substitute/solve/extract events for every point
+    solver : SolverConfig
+        Backend and tolerances; gpkit's defaults when None
+    """
+    def __init__(self, model, outputs, parameters=None, warm_start=False,
+                 signomial=None, cache=None, telemetry=None, solver=None):
+        self.model = model
+        self.outputs = outputs
+        self.parameters = parameters or {}
+        self.warm_start = warm_start
+        self.seeds = None
+        if signomial is None:
+            signomial = is_signomial(model)
+        self.signomial = signomial
+        self.cache = cache
+        self.structure = structure_key(model) if cache is not None else None
+        self.telemetry = telemetry or NULL
+        self.solver = solver or DEFAULT
+
+    def key(self, name):
+        "The variable a point column refers to"
+        if name in self.parameters:
+            return self.parameters[name]
+        return name
+
+    def solve(self, substitutions, verbosity=0, x0=None, point=None):
+        """Solves the model at a single point
+
+        Returns the SolutionArray and the number of GPs solved, which for
+        signomial models is the sequential-GP iteration count (zero when
+        the solution came from the cache).
+        """
+        model = self.model
+        telemetry = self.telemetry
+        old = dict((self.key(k), model.substitutions[self.key(k)])
+                   for k in substitutions)
+        try:
+            with telemetry.phase("substitute", point=point):
+                model.substitutions.update(
+                    dict((self.key(k), v) for k, v in substitutions.items()))
+            key = None
+            if self.cache is not None:
+                with telemetry.phase("cache", point=point) as event:
+                    key = model_key(model, self.structure, self.solver)
+                    sol = self.cache.get(key)
+                    event["hit"] = sol is not None
+                if sol is not None:
+                    return rekeyed(sol, model), 0
+            with telemetry.phase("solve", point=point,
+                                 warm=x0 is not None) as event:
+                if self.signomial:
+                    sol = self.solver.solve(model, True, verbosity, x0=x0)
+                    iterations = len(model.program.gps)
+                else:
+                    sol = self.solver.solve(model, False, verbosity)
+                    iterations = 1
+                event["iterations"] = iterations
+                event["iteration_seconds"] = iteration_times(model)
+            if key:
+                self.cache.put(key, sol)
+            return sol, iterations
+        finally:
+            model.substitutions.update(old)
+
+    def read(self, sol):
+        "Output column values for one solution"
+        return [getattr(sol(var), "magnitude", sol(var))
+                for var in self.outputs.values()]
+
+    def dtype(self, names):
+        """Structured dtype for the given input columns plus the outputs
+
+        Vector outputs, e.g. per-segment fuel weight, become array fields.
+        """
+        return np.dtype([(str(n), float) for n in names]
+                        + [(str(n), float, getattr(v, "shape", ()))
+                           for n, v in self.outputs.items()]
+                        + [("feasible", bool), ("iterations", int),
+                           ("soltime", float)])
+
+    def run(self, points, verbosity=0):
+        """Solves every point, returning a structured array with one row each
+
+        `points` maps parameter names (or variables) to equal-length arrays;
+        row i solves with the i-th value of every column. Infeasible and
+        unbounded points are kept with feasible=False and NaN outputs, the
+        failure going to telemetry as an "infeasible" event; any other error
+        raises.
+        """
+        names = list(points)
+        columns = [np.atleast_1d(np.asarray(points[n], dtype=float))
+                   for n in names]
+        n_points = len(columns[0]) if columns else 0
+        if any(len(c) != n_points for c in columns):
+            raise ValueError("sweep columns must all have the same length")
+        result = np.zeros(n_points, dtype=self.dtype(names))
+        for name, column in zip(names, columns):
+            result[str(name)] = column
+        seeds = None
+        if self.warm_start:
+            # solved points are kept across runs over the same parameters
+            if self.seeds is None or self.seeds.names != names:
+                self.seeds = WarmStarts(names)
+            seeds = self.seeds
+        for i in range(n_points):
+            subs = dict((n, c[i]) for n, c in zip(names, columns))
+            point = np.array([c[i] for c in columns])
+            x0 = seeds.nearest(point) if seeds else None
+            sol = self.fill(result[i], subs, verbosity, x0, point=i)
+            if seeds and sol is not None:
+                seeds.add(point, sol["freevariables"])
+        return result
+
+    def fill(self, row, substitutions, verbosity=0, x0=None, point=None):
+        "Solves one point and writes its outputs into a result row"
+        start = time()
+        try:
+            sol, row["iterations"] = self.solve(substitutions, verbosity, x0,
+                                                point)
+        except SOLVE_ERRORS as e:
+            self.telemetry.emit("infeasible", point=point,
+                                error=type(e).__name__, message=str(e))
+            for name in self.outputs:
+                row[str(name)] = np.nan
+            row["feasible"] = False
+            row["soltime"] = time() - start
+            return None
+        with self.telemetry.phase("extract", point=point):
+            for name, value in zip(self.outputs, self.read(sol)):
+                row[str(name)] = value
+        row["feasible"] = True
+        row["soltime"] = time() - start
+        return sol
+
+
+class WarmStarts(object):
+    "Solved points of a sweep, searched for the nearest seed"
+    def __init__(self, names):
+        self.names = names
+        self.points = []
+        self.x0 = []
+
+    def add(self, point, freevariables):
+        self.points.append(point)
+        self.x0.append(freevariables)
+
+    def nearest(self, point):
+        "Free-variable values of the solved point closest to point"
+        if not self.points:
+            return None
+        points = np.array(self.points)
+        # Normalize each column to its span so no parameter's units dominate
+        span = np.ptp(np.vstack([points, point]), axis=0)
+        dist = (((points - point)/np.where(span > 0, span, 1))**2).sum(axis=1)
+        return self.x0[int(np.argmin(dist))]
+
+
+def is_signomial(model):
+    "Whether the model needs sequential GP solves"
+    try:
+        model.gp(verbosity=0)
+    except TypeError:  # raised by constraints that can't become posynomials
+        return True
+    return False
+
+
+def grid(axes):
+    "Expands a dict of 1-D value axes into full-factorial Sweep point columns"
+    names = list(axes)
+    mesh = np.meshgrid(*[np.asarray(axes[n], dtype=float) for n in names],
+                       indexing="ij")
+    return dict((n, m.ravel()) for n, m in zip(names, mesh))
@@ -0,0 +1,86 @@
+"""Structured timing events and optional profiling around solve phases"""
+import os
+import json
+import cProfile
+from time import time
+from contextlib import contextmanager
+
+
+class Telemetry(object):
+    """Emits one JSON line per phase of the solve pipeline
+
+    Arguments
+    ---------
+    stream : file or str
+        Where events are written; a str is opened for appending.
+        None records nothing (the default for every entry point).
+    profile : iterable of str
+        Phase names to run under cProfile
+    profile_dir : str
+        Where .prof files are written, one per profiled phase call
+    """
+    def __init__(self, stream=None, profile=(), profile_dir="."):
+        if isinstance(stream, str):
+            stream = open(stream, "a")
+        self.stream = stream
+        self.profile = set(profile)
+        self.profile_dir = profile_dir
+        self.count = 0
+
+    def emit(self, event, **fields):
+        "Writes an event line"
+        if self.stream is None:
+            return
+        fields["event"] = event
+        fields.setdefault("time", time())
+        self.stream.write(json.dumps(fields, sort_keys=True, default=float)
+                          + "\n")
+        self.stream.flush()
+
+    @contextmanager
+    def phase(self, name, **fields):
+        """Times the enclosed block and emits it as an event
+
+        Yields the event's field dict so the block can attach results,
+        e.g. iteration counts, before it is written.
+        """
+        self.count += 1
+        profiler = cProfile.Profile() if name in self.profile else None
+        start = time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield fields
+        finally:
+            if profiler:
+                profiler.disable()
+                path = os.path.join(self.profile_dir,
+                                    "%s-%d.prof" % (name, self.count))
+                profiler.dump_stats(path)
+                fields["profile"] = path
+            fields["seconds"] = time() - start
+            self.emit(name, **fields)
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+
+
+# Records nothing; used when no Telemetry is given
+NULL = Telemetry()
+
+
+def iteration_times(model):
+    """Solver seconds of each GP in the model's last solve
+
+    One entry per sequential-GP iteration; None where gpkit did not record
+    a time.
+    """
+    program = model.program
+    # gpkit >= 1.0 reuses one GP for every iteration, keeping each
+    # iteration's solver output in solver_outs
+    outs = getattr(program, "solver_outs", None)
+    if outs is None:
+        outs = [getattr(gp, "solver_out", None)
+                for gp in getattr(program, "gps", [program])]
+    return [(out or {}).get("soltime") for out in outs]
@@ -0,0 +1,81 @@
+import aircraft
+
+
+def test_build_model_solves():
+    model = aircraft.build_model()
+    sol = model.solve(verbosity=0)
+    assert sol(model.mission.range).magnitude > 0
+    assert sol(model.aircraft.weight).magnitude > 0
+
+
+def test_mission_needs_cruise_segment():
+    import pytest
+    with pytest.raises(ValueError):
+        aircraft.build_model(segments=1)
+
+
+def test_spanwise_spar_carries_takeoff_weight():
+    model = aircraft.build_model(spar_stations=10)
+    sol = model.solve(verbosity=0)
+    load = model.aircraft.spar_load
+    W_MTO = sol(model.aircraft["W_MTO"]).magnitude
+    assert W_MTO > sol(model.aircraft.weight).magnitude
+    q = sol(load["q"]).magnitude
+    assert q[0] >= 3*W_MTO/(2*sol(model.aircraft.spar["l"]).magnitude)
+
+
+def test_scenarios_set_cruise_conditions_only():
+    import numpy as np
+    model = aircraft.build_scenarios([
+        {"name": "fast", "V": 40, "range": 500e3},
+        {"name": "thin", "rho": 1.1, "Vmin": 22, "range": 400e3}])
+    sol = model.solve(verbosity=0)
+    fast, thin = model.scenarios.missions
+    V = sol(fast.flight_segments.flightstate["V"]).magnitude
+    assert np.allclose(V[1:], 40) and V[0] <= 20.1168*(1 + 1e-6)
+    rho = sol(thin.flight_segments.flightstate["\\rho"]).magnitude
+    assert np.allclose(rho[1:], 1.1) and np.isclose(rho[0], 1.225)
+    margin = sol(model.scenarios.margin).magnitude
+    assert np.isclose(margin, min(sol(m.range).magnitude/t for m, t in
+                                  zip(model.scenarios.missions,
+                                      model.scenarios.targets)), rtol=1e-4)
+
+
+def test_scenarios_reject_unsupported_values():
+    import pytest
+    with pytest.raises(ValueError):
+        aircraft.build_scenarios([{"payload": 900}])
+
+
+def test_main_closes_telemetry_when_solve_fails(monkeypatch, tmp_path):
+    import pytest
+    import telemetry
+    from diagnostics import SolveFailed
+    closed = []
+
+    def fail(*args, **kwargs):
+        raise SolveFailed("infeasible", {})
+    monkeypatch.setattr(aircraft, "solve", fail)
+    monkeypatch.setattr(telemetry.Telemetry, "close",
+                        lambda self: closed.append(self))
+    with pytest.raises(SystemExit):
+        aircraft.main(["--no-vsp", "--telemetry",
+                       str(tmp_path / "events.jsonl")])
+    assert len(closed) == 1
+
+
+def test_main_reports_range_in_km(capsys):
+    aircraft.main(["--no-vsp"])
+    out = capsys.readouterr().out
+    line, = [l for l in out.splitlines() if l.startswith("Mission: range")]
+    assert line.endswith(" km") and "meter" not in line
+    assert float(line.split()[3]) > 100
+
+
+def test_spanwise_spar_solves_at_every_station_count():
+    import bench
+    rows = bench.stations((10, 25, 40), repeats=1)
+    assert [n for n, _, _ in rows] == [10, 25, 40]
+    for n in (25, 40):
+        model = aircraft.build_model(spar_stations=n)
+        assert model.solve(verbosity=0)["cost"] > 0
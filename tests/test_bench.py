@@ -0,0 +1,22 @@
+import json
+import pytest
+import bench
+
+
+@pytest.mark.parametrize("argv", [["segments", "4", "5"],
+                                  ["stations", "10", "12"],
+                                  ["solvers"],
+                                  ["solvers", "--model", "ekranoopt"]])
+def test_subcommands_run(argv, capsys):
+    bench.main(argv + ["--repeats", "1"])
+    assert capsys.readouterr().out
+
+
+def test_phases_records_history(tmp_path, capsys):
+    history = str(tmp_path / "bench.json")
+    bench.main(["phases", "--repeats", "1", "--history", history])
+    with open(history) as f:
+        [run] = json.load(f)
+    assert sorted(run["results"]) == ["ekranoopt", "modular"]
+    assert "diagnose" in run["results"]["modular"]
+    assert "modular:" in capsys.readouterr().out
@@ -0,0 +1,75 @@
+from gpkit import Model, Variable
+from cache import SolutionCache, model_key
+
+
+def test_lru_and_disk(tmp_path):
+    cache = SolutionCache(str(tmp_path), maxsize=2, maxdisk=2)
+    for key in "abc":
+        cache.put(key, {"cost": key})
+    assert len(cache) == 2
+    assert cache.get("a") is None  # evicted from memory and disk
+    assert cache.get("c") == {"cost": "c"}
+    assert SolutionCache(str(tmp_path)).get("b") == {"cost": "b"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_memory_only():
+    cache = SolutionCache(None)
+    cache.put("k", 1)
+    assert cache.get("k") == 1
+    cache.clear()
+    assert cache.get("k") is None
+
+
+class Box(Model):
+    def setup(self):
+        x = Variable("x", "m")
+        a = Variable("a", 2, "m")
+        return [x >= a]
+
+
+def build():
+    box = Box()
+    return Model(box["x"], [box])
+
+
+def test_key_is_stable_across_builds():
+    first, second = build(), build()
+    assert str(first) != str(second)  # gpkit numbered the second Box
+    assert model_key(first) == model_key(second)
+    second.substitutions[second["a"]] = 3
+    assert model_key(first) != model_key(second)
+
+
+def test_key_includes_solver():
+    from solvers import SolverConfig
+    model = build()
+    assert (model_key(model, solver=SolverConfig())
+            != model_key(model, solver=SolverConfig(reltol=1e-4)))
+    assert (model_key(model, solver=SolverConfig(reltol=1e-4))
+            == model_key(model, solver=SolverConfig(reltol=1e-4)))
+
+
+def test_hit_from_an_earlier_build_reads_the_new_model():
+    import aircraft
+    from sweep import Sweep
+    cache = SolutionCache(None)
+    first = aircraft.build_model()
+    direct = aircraft.solve(first, cache=cache)
+    second = aircraft.build_model()
+    sol = aircraft.solve(second, cache=cache)
+    assert cache.hits == 1
+    for old, new in [(first.mission.range, second.mission.range),
+                     (first.aircraft.wing["b"], second.aircraft.wing["b"])]:
+        assert sol(new) == direct(old)
+    assert second.mission.range.key.str_without(["units"]) in sol.table()
+
+    def run(model):
+        outputs = {"range": model.mission.range,
+                   "b": model.aircraft.wing["b"]}
+        return Sweep(model, outputs, cache=cache).run(
+            {model.aircraft.pilot["W"]: [200.0]})[0]
+    cold, warm = run(first), run(second)
+    assert warm["feasible"] and warm["iterations"] == 0
+    assert cold["iterations"] == 1
+    assert (warm["range"], warm["b"]) == (cold["range"], cold["b"])
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+import aircraft
+from cache import SolutionCache
+
+
+def test_matches_sweep_on_merged_and_power_law_parameters():
+    with pytest.warns(UserWarning, match="Pilot.W"):
+        compiled = aircraft.build_sweep(compiled=True)
+    assert "Pilot.W" in compiled.uncompiled
+    assert "Propeller.diameter" not in compiled.uncompiled
+    sweep = aircraft.build_sweep()
+    for points in ({"Pilot.W": [700., 900.]},
+                   {"Propeller.diameter": [1.4, 1.6],
+                    "Hull.S_wet": [5.0, 5.5]}):
+        assert np.allclose(compiled.run(points)["range"],
+                           sweep.run(points)["range"], rtol=1e-4)
+
+
+def test_uses_the_cache():
+    cache = SolutionCache(None)
+    with pytest.warns(UserWarning):
+        compiled = aircraft.build_sweep(compiled=True, cache=cache)
+    points = {"Propeller.diameter": [1.4, 1.4]}
+    rows = compiled.run(points)
+    assert list(rows["iterations"]) == [1, 0]
+    assert cache.hits == 1
@@ -0,0 +1,56 @@
+import pytest
+from gpkit import Model, Variable
+import diagnostics
+
+
+def infeasible():
+    x, a = Variable("x"), Variable("a", 3)
+    return Model(x, [x >= a, x <= 2])
+
+
+def test_flat_constraints():
+    assert len(diagnostics.flat_constraints(infeasible())) == 2
+
+
+def test_diagnose_names_what_to_relax():
+    report = diagnostics.diagnose(infeasible())
+    assert not report["errors"]
+    assert report["constraints"]
+    assert [c["variable"] for c in report["constants"]] == ["a"]
+
+
+def test_failed_solve_carries_report():
+    with pytest.raises(diagnostics.SolveFailed) as info:
+        diagnostics.solve(infeasible())
+    assert info.value.report["constants"]
+
+
+def test_infeasible_aircraft_is_diagnosed():
+    import aircraft
+    model = aircraft.build_model()
+    model.substitutions[model.aircraft.pilot["W"]] = 1e6
+    with pytest.raises(diagnostics.SolveFailed) as info:
+        aircraft.solve(model)
+    report = info.value.report
+    weight = model.aircraft.weight.key.str_without(["units"])
+    assert any(c["constraint"].startswith(weight + " ≥")
+               for c in report["constraints"])
+    assert all(c["relaxation"] > 1 for c in report["constraints"])
+
+
+def test_failed_diagnosis_reports_the_solve_error(monkeypatch):
+    def broken(model):
+        raise IndexError("relaxation")
+    monkeypatch.setattr(diagnostics, "diagnose", broken)
+    with pytest.raises(diagnostics.SolveFailed) as info:
+        diagnostics.solve(infeasible())
+    assert "Solver failed" in str(info.value)
+    assert info.value.report["errors"] == ["diagnosis: IndexError: relaxation"]
+
+
+def test_diagnose_leaves_the_model_solvable():
+    import aircraft
+    model = aircraft.build_model()
+    cost = model.solve(verbosity=0)["cost"]
+    diagnostics.diagnose(model)
+    assert model.solve(verbosity=0)["cost"] == pytest.approx(cost)
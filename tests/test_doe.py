@@ -0,0 +1,19 @@
+import functools
+import numpy as np
+import aircraft
+from doe import run_doe
+from store import open_store
+
+
+def test_rows_with_segment_vectors_reach_the_store(tmp_path):
+    path = str(tmp_path / "doe.store")
+    build = functools.partial(aircraft.build_sweep, vectors=True)
+    points = {"Pilot.W": [700., 750., 800.]}
+    rows = run_doe(build, points, processes=2, chunksize=1, store=path)
+    stored = open_store(path)
+    assert len(stored) == 3
+    assert stored.dtype["throttle"].shape == (4,)
+    assert np.all(stored["feasible"])
+    assert np.allclose(stored["W_{fuel}"], rows["W_{fuel}"])
+    assert np.all(np.diff(stored["W_{fuel}"], axis=1) < 0)
+    assert list(stored["Pilot.W"]) == points["Pilot.W"]
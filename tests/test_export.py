@@ -0,0 +1,34 @@
+import os
+import shutil
+import numpy as np
+import export
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IDS = {"b": ["IRQEKLNIYLX", "FUGWYXQTPNJ"]}
+
+
+def test_export_is_content_addressed(tmp_path):
+    template = str(tmp_path / "design.des")
+    shutil.copy(os.path.join(ROOT, "design.des"), template)
+    rows = np.array([(10., True), (12., True), (13., False)],
+                    dtype=[("b", float), ("feasible", bool)])
+    out = str(tmp_path / "designs")
+    directories, statuses = export.export(rows, IDS, out, template)
+    assert sorted(directories) == [0, 1]
+    assert statuses == {}
+    script = os.path.join(directories[0], "reload.vspscript")
+    mtime = os.path.getmtime(script)
+    again, _ = export.export(rows, IDS, out, template)
+    assert again == directories
+    assert os.path.getmtime(script) == mtime
+
+
+def test_command_runs_once(tmp_path):
+    template = str(tmp_path / "design.des")
+    shutil.copy(os.path.join(ROOT, "design.des"), template)
+    rows = np.array([(10.,)], dtype=[("b", float)])
+    out = str(tmp_path / "designs")
+    _, statuses = export.export(rows, IDS, out, template, command=["true"])
+    assert list(statuses.values()) == [0]
+    directory = list(statuses)[0]
+    assert os.path.exists(os.path.join(directory, "done"))
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from external import ExternalCall
+
+
+def test_memo_and_batching():
+    batches = []
+
+    def f(xs):
+        batches.append(len(xs))
+        return np.asarray(xs)**2
+    call = ExternalCall(f, rtol=1e-3)
+    assert np.allclose(call.evaluate([1, 2, 2, 3]), [1, 4, 4, 9])
+    assert batches == [3]
+    assert call(2.0001) == 4
+    assert call.hits == 1
+    assert batches == [3]
+
+
+def test_step_must_exceed_memo_tolerance():
+    from gpkit import Variable
+    from external import ExternalConstraint
+    x, y = Variable("x"), Variable("y")
+    with pytest.raises(ValueError):
+        ExternalConstraint(x, y, ExternalCall(np.sqrt, rtol=1e-3), 1,
+                           step=1e-3)
+    constraint = ExternalConstraint(x, y, ExternalCall(np.sqrt), 4.0)
+    fit = constraint.as_gpconstr({})
+    assert "0.5" in str(fit)
+
+
+def test_context_manager_closes_pool():
+    with ExternalCall(abs, processes=1) as call:
+        assert call.evaluate([-2.0]) == [2.0]
+        assert call.pool is not None
+    assert call.pool is None
+
+
+def test_localsolve_tracks_external_function():
+    from gpkit import Model, Variable
+    from gpkit.exceptions import InvalidGPConstraint
+    from external import ExternalConstraint
+    x, y = Variable("x"), Variable("y")
+    call = ExternalCall(np.square)
+    model = Model(y, [ExternalConstraint(x, y, call, 1.0), x >= 3])
+    with pytest.raises(InvalidGPConstraint):
+        model.solve(verbosity=0)
+    sol = model.localsolve(verbosity=0)
+    assert abs(sol(x) - 3) < 1e-3
+    assert abs(sol(y) - 9) < 1e-2
+    assert call.calls > 2
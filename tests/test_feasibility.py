@@ -0,0 +1,26 @@
+import numpy as np
+from gpkit import Model, Variable
+from feasibility import boundary, relaxed_sweep
+from sweep import Sweep
+
+
+def toy():
+    "Feasible while a <= 2"
+    x, a = Variable("x"), Variable("a", 1)
+    return Sweep(Model(x, [x >= a, x <= 2]), {"x": x}, {"a": a})
+
+
+def test_relaxation_measures_distance_from_feasibility():
+    rows = relaxed_sweep(toy()).run({"a": [1, 3, 4]})
+    assert np.all(rows["feasible"])
+    # both constraints relax equally, each by sqrt(a/2)
+    assert np.allclose(rows["relaxation"], np.sqrt([1, 1.5, 2]), rtol=1e-3)
+
+
+def test_boundary_bisects_to_the_edge():
+    fmap = boundary(toy(), {"a": (1, 4)}, coarse=3, depth=6)
+    assert len(fmap.boundary) == 1
+    edge = fmap.boundary[0]
+    assert edge["a"] <= 2 <= edge["a_out"]
+    assert edge["a_out"] - edge["a"] < 0.05
+    assert edge["relaxation"] > 1
@@ -0,0 +1,24 @@
+import os
+import numpy as np
+import geometry
+
+SKETCH = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "sketch.vsp3")
+
+
+def test_wing_matches_vsp_totals():
+    parms = geometry.read_geometry(SKETCH)["WingGeom"]["parms"]
+    wing = geometry.wing(filename=SKETCH).evaluate()
+    assert np.isclose(wing["S"][0], parms["TotalArea"])
+    assert np.isclose(wing["b"][0], parms["TotalSpan"])
+
+
+def test_variants_broadcast():
+    body = geometry.body(filename=SKETCH)
+    base = body.evaluate()
+    scaled = body.evaluate(length_scale=1, width_scale=[1, 2])
+    assert scaled["S_wet"].shape == (2,)
+    assert np.isclose(scaled["S_wet"][0], base["S_wet"][0])
+    assert np.isclose(scaled["V"][1], 2*base["V"][0])
+    wing = geometry.wing(filename=SKETCH).evaluate(span_scale=[1, 2])
+    assert np.allclose(wing["S"][1], 2*wing["S"][0])
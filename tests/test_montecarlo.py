@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from gpkit import Model, Variable
+import aircraft
+from montecarlo import monte_carlo, sampler
+from store import open_store
+from sweep import Sweep
+
+
+def test_samples_are_positive():
+    rng = np.random.RandomState(0)
+    values = sampler(("normal", 0.1, 1))(rng, 1000)
+    assert np.all(values > 0)
+    with pytest.raises(ValueError):
+        sampler(("uniform", -2, 0))(rng, 10)
+
+
+def toy_sweep():
+    "Feasible while a <= 2; the solver raises beyond it"
+    x, a = Variable("x"), Variable("a", 1)
+    return Sweep(Model(x, [x >= a, x <= 2]), {"x": x}, {"a": a})
+
+
+def test_failures_are_infeasible_rows():
+    result = monte_carlo(toy_sweep, {"a": ("uniform", 1, 3)}, samples=40,
+                         batch=20, outputs=("x",), q=(50,), seed=1)
+    assert 0 < result["feasible_fraction"] < 1
+    assert result["percentiles"]["x"][0] <= 2
+
+
+def test_pool_and_store(tmp_path):
+    path = str(tmp_path / "mc.store")
+    result = monte_carlo(aircraft.build_sweep,
+                         {"Pilot.W": ("normal", 750, 30)}, samples=8,
+                         batch=4, rtol=0, processes=2, store=path, seed=0)
+    assert result["samples"] == 8
+    assert len(open_store(path)) == 8
@@ -0,0 +1,18 @@
+import numpy as np
+import aircraft
+import pareto
+
+
+def test_anchors_are_bounded():
+    low, high = pareto.anchors(aircraft.build_sweep(), "range", "W")
+    assert 0 < low < high
+
+
+def test_front_is_monotonic_and_parallel_matches():
+    serial = pareto.front(aircraft.build_sweep, points=4, max_points=6)
+    assert len(serial) >= 4
+    assert np.all(np.diff(serial["W"]) > 0)
+    assert np.all(np.diff(serial["range"]) > 0)
+    parallel = pareto.front(aircraft.build_sweep, points=4, max_points=6,
+                            processes=2)
+    assert np.allclose(parallel["range"], serial["range"], rtol=1e-4)
@@ -0,0 +1,49 @@
+import warnings
+import pytest
+from gpkit import Model, Variable
+import aircraft
+import presolve
+
+
+def test_presolve_keeps_the_optimum(capsys):
+    model = aircraft.build_model()
+    cost = model.solve(verbosity=0)["cost"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", presolve.PresolveWarning)
+        reduced, report = presolve.presolve(model, presolve.declared(model))
+    assert reduced.solve(verbosity=0)["cost"] == pytest.approx(cost, rel=1e-4)
+    assert report["after"]["constraints"] <= report["before"]["constraints"]
+    assert capsys.readouterr().out == ""
+
+
+def test_vector_variables_are_not_unused():
+    model = aircraft.build_model()
+    unused = presolve.unused(model, presolve.declared(model))
+    used = set(str(key) for key in model.varkeys)
+    assert not [name for name in unused
+                if any(u.startswith(name + "[") for u in used)]
+
+
+def test_duplicates_and_unused():
+    x = Variable("x")
+    p1, p2 = Variable("P", label="cruise"), Variable("P", 5, label="max")
+    z = Variable("z", 2)
+    model = Model(x, [x >= p1, p1 >= 1])
+    names = [name for name, _ in presolve.duplicates(model, [p1, p2])]
+    assert names == ["P"]
+    assert "z" in presolve.unused(model, [x, p1, z])
+
+
+def test_unused_variables_are_found():
+    model = aircraft.build_model()
+    unused = presolve.unused(model, presolve.declared(model))
+    names = set(name.split(".")[-1] for name in unused)
+    assert {"z_bre", "LD[:]", "sigma[:]"} <= names
+    assert "range" not in names and "W" not in names
+
+
+def test_near_zero_skips_values_with_units():
+    x, mdot = Variable("x"), Variable("mdot", "kg/s")
+    eps, bsfc = Variable("eps", 1e-9), Variable("BSFC", 1.4e-7, "kg/s/W")
+    model = Model(x, [x >= 1 + eps, mdot >= bsfc*Variable("P", 1e6, "W")])
+    assert presolve.near_zero(model.substitutions) == ["eps"]
@@ -0,0 +1,43 @@
+import numpy as np
+from gpkit import Model, Variable
+from sensitivity import Predictor
+from sweep import Sweep
+
+
+def model():
+    x, a, b = Variable("x"), Variable("a", 2), Variable("b", 3)
+    return Model(x, [x >= a*b]), a, b
+
+
+def test_prediction_independent_of_query_order():
+    m, a, b = model()
+    sweep = Sweep(m, {}, {"a": a, "b": b})
+    forward = Predictor(sweep, threshold=0.5)
+    forward.predict({"a": 4})  # a large change, so it rebases at a=4
+    assert forward.solves == 2
+    assert np.isclose(forward.predict({"b": 3.3}), 2*3.3)
+    backward = Predictor(sweep, threshold=0.5)
+    assert np.isclose(backward.predict({"b": 3.3}), 2*3.3)
+    assert np.isclose(forward.predict({a: 4.1}), 4.1*3)
+
+
+def test_small_changes_are_predicted():
+    m, a, _ = model()
+    predictor = Predictor(Sweep(m, {}, {"a": a}), threshold=0.05)
+    assert np.isclose(predictor.predict({"a": 2.1}), 2.1*3)
+    assert (predictor.solves, predictor.predictions) == (1, 1)
+    assert np.isclose(m.substitutions[a], 2)
+
+
+def test_export_aircraft_sensitivities(tmp_path):
+    import csv
+    import aircraft
+    from sensitivity import export_sensitivities
+    sol = aircraft.build_model().solve(verbosity=0)
+    path = str(tmp_path / "sens.csv")
+    export_sensitivities(sol, path)
+    with open(path) as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["variable", "value", "units", "sensitivity"]
+    assert len(rows) - 1 == len(sol["constants"])
+    assert not any(row[0].endswith("Mission.range") for row in rows)
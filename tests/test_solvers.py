@@ -0,0 +1,36 @@
+import warnings
+import pytest
+import solvers
+from solvers import SolverConfig
+
+
+def test_tolerances_need_cvxopt():
+    with pytest.raises(ValueError):
+        SolverConfig("mosek_conif", reltol=1e-4)
+    SolverConfig("mosek_conif")
+    SolverConfig("cvxopt", reltol=1e-4)
+
+
+def test_tolerances_applied_to_cvxopt_and_restored():
+    from cvxopt import solvers as cvx
+    before = dict(cvx.options)
+    with SolverConfig("cvxopt", reltol=1e-4).applied():
+        assert cvx.options["reltol"] == 1e-4
+    assert cvx.options == before
+
+
+def test_warns_when_default_backend_is_not_cvxopt(monkeypatch):
+    monkeypatch.setattr(solvers, "default_backend", lambda: "mosek_conif")
+    with pytest.warns(UserWarning, match="reltol"):
+        with SolverConfig(reltol=1e-4).applied():
+            pass
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with SolverConfig().applied():
+            pass
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError, match="unknown solver"):
+        SolverConfig("mosek")
+    assert set(solvers.available()) <= set(solvers.BACKENDS)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from store import ResultStore, open_store, read_header
+
+DTYPE = np.dtype([("range", float), ("W_fuel", float, (4,)), ("ok", bool)])
+
+
+def rows(n):
+    out = np.zeros(n, dtype=DTYPE)
+    out["range"] = np.arange(n)
+    out["W_fuel"] = np.arange(4*n).reshape(n, 4)
+    out["ok"] = True
+    return out
+
+
+def test_append_and_map(tmp_path):
+    path = str(tmp_path / "results.store")
+    store = ResultStore(path, DTYPE)
+    store.append(rows(3))
+    store.append(rows(2))
+    assert len(store) == 5
+    mapped = open_store(path)
+    assert mapped.dtype == DTYPE
+    assert list(mapped["range"]) == [0, 1, 2, 0, 1]
+    assert mapped["W_fuel"][2].tolist() == [8, 9, 10, 11]
+
+
+def test_reopen_checks_dtype(tmp_path):
+    path = str(tmp_path / "results.store")
+    ResultStore(path, DTYPE)
+    assert read_header(path) == DTYPE
+    assert ResultStore(path).dtype == DTYPE
+    with pytest.raises(ValueError):
+        ResultStore(path, [("other", float)])
+
+
+def test_empty_store(tmp_path):
+    path = str(tmp_path / "results.store")
+    ResultStore(path, DTYPE)
+    assert len(open_store(path)) == 0
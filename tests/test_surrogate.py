@@ -0,0 +1,56 @@
+import numpy as np
+from surrogate import Surrogate
+
+
+def test_monomial_is_served_after_sampling(tmp_path):
+    calls = []
+
+    def f(x):
+        calls.append(len(np.atleast_1d(x)))
+        return 3*np.asarray(x)**-0.5
+    s = Surrogate(f, str(tmp_path / "samples.csv"), rtol=1e-6)
+    s(np.linspace(1, 10, 6))
+    assert s.calls == 6
+    assert np.isclose(s(4.0), 1.5)
+    assert s.served == 1
+
+
+def test_samples_persist(tmp_path):
+    path = str(tmp_path / "samples.csv")
+    f = lambda x: 2*np.asarray(x)
+    Surrogate(f, path)(np.linspace(1, 2, 5))
+    again = Surrogate(f, path)
+    assert len(again.Y) == 5
+    again(1.5)
+    assert again.calls == 0
+
+
+def test_outside_samples_calls_f():
+    s = Surrogate(lambda x: np.asarray(x)**2, rtol=1e-6)
+    s(np.linspace(1, 2, 5))
+    s(10.0)
+    assert s.calls == 6
+
+
+def test_served_where_locally_accurate():
+    def f(x):
+        x = np.asarray(x)
+        return np.where(x < 2, x**2, x**2*(1.5 + np.sin(5*x)))
+    s = Surrogate(f, rtol=1e-3, kind="interp")
+    s(np.concatenate([np.linspace(1, 2, 41), np.linspace(2.5, 10, 6)]))
+    calls = s.calls
+    assert np.isclose(s(1.51), 1.51**2, rtol=1e-3)
+    assert s.calls == calls
+    s(6.0)
+    assert s.calls == calls + 1
+
+
+def test_monomial_fit_rejects_outlying_region():
+    def f(x):
+        x = np.asarray(x)
+        return np.where(x < 5, 2*x, 2*x*(1 + 0.3*(x - 5)))
+    s = Surrogate(f, rtol=0.05)
+    s(np.linspace(1, 10, 20))
+    calls = s.calls
+    s(9.9)
+    assert s.calls == calls + 1
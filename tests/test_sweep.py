@@ -0,0 +1,63 @@
+import io
+import json
+import numpy as np
+from gpkit import Model, Variable
+from sweep import Sweep, grid
+from telemetry import Telemetry
+
+
+def test_failed_points_become_infeasible_rows():
+    x = Variable("x")
+    a = Variable("a", 1)
+    model = Model(x, [x >= a, x <= 2])
+    stream = io.StringIO()
+    sweep = Sweep(model, {"x": x}, {"a": a}, telemetry=Telemetry(stream))
+    result = sweep.run({"a": [1, 3, 1.5]})
+    assert list(result["feasible"]) == [True, False, True]
+    assert np.isclose(result["x"][2], 1.5)
+    assert np.isnan(result["x"][1])
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    failed = [e for e in events if e["event"] == "infeasible"]
+    assert [e["point"] for e in failed] == [1]
+    assert failed[0]["error"] and failed[0]["message"]
+
+
+def test_grid():
+    points = grid({"a": [1, 2], "b": [3, 4, 5]})
+    assert len(points["a"]) == 6
+    assert list(points["b"][:3]) == [3, 4, 5]
+
+
+def test_configuration_errors_raise():
+    import pytest
+    x = Variable("x")
+    a = Variable("a", 1)
+    sweep = Sweep(Model(x, [x >= a]), {"x": x}, {"a": a})
+    with pytest.raises(TypeError):  # a negative fixed value isn't a GP
+        sweep.run({"a": [1, -1]})
+
+
+def test_warm_starts_cut_signomial_iterations():
+    from gpkit import SignomialsEnabled
+    x, y = Variable("x"), Variable("y")
+    a = Variable("a", 1)
+    with SignomialsEnabled():
+        model = Model(x, [x >= 1 - y, y <= 0.1*a, x >= 1e-3])
+    points = {"a": np.linspace(1, 2, 5)}
+    cold = Sweep(model, {"x": x}, {"a": a}).run(points)
+    warm = Sweep(model, {"x": x}, {"a": a}, warm_start=True).run(points)
+    assert np.allclose(warm["x"], cold["x"], rtol=1e-4)
+    assert warm["iterations"][0] == cold["iterations"][0]
+    assert np.all(warm["iterations"][1:] < cold["iterations"][1:])
+
+
+def test_iteration_times_are_per_iteration():
+    from gpkit import SignomialsEnabled
+    from telemetry import iteration_times
+    x, y = Variable("x"), Variable("y")
+    with SignomialsEnabled():
+        model = Model(x, [x >= 1 - y, y <= 0.1, x >= 1e-3])
+    model.localsolve(verbosity=0)
+    times = iteration_times(model)
+    assert len(times) == len(model.program.gps) > 1
+    assert len(set(times)) == len(times)
@@ -0,0 +1,56 @@
+import os
+import shutil
+import pytest
+import vsp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def workdir(tmp_path):
+    for name in ("design.des", "sketch.vsp3"):
+        shutil.copy(os.path.join(ROOT, name), str(tmp_path / name))
+    return tmp_path
+
+
+def test_des_update_only_changes_given_ids(workdir):
+    path = str(workdir / "design.des")
+    des = vsp.DesFile(path)
+    before = des.text()
+    assert des.update({"IRQEKLNIYLX": 7.5, "NOSUCHID": 1}) == ["IRQEKLNIYLX"]
+    des.save()
+    after = vsp.DesFile(path)
+    assert after.lines[after.index["IRQEKLNIYLX"]].endswith(" 7.5")
+    changed = [a for a, b in zip(before.split("\n"), after.lines) if a != b]
+    assert len(changed) == 1
+
+
+def test_write_des_files(workdir):
+    designs = [{"IRQEKLNIYLX": b} for b in (1.0, 2.0)]
+    paths = list(vsp.writeDesFiles(designs, str(workdir / "design.des"),
+                                   str(workdir)))
+    assert [vsp.DesFile(p).lines[vsp.DesFile(p).index["IRQEKLNIYLX"]]
+            .split(":")[-1] for p in paths] == [" 1.0", " 2.0"]
+
+
+def test_vsp3_parameters_roundtrip(workdir):
+    source = str(workdir / "sketch.vsp3")
+    target = str(workdir / "design.vsp3")
+    parms = vsp.parameterIndex(source)
+    assert parms["FUGWYXQTPNJ"].name.endswith("TotalSpan")
+    assert "FUGWYXQTPNJ" in vsp.findParameters("TotalSpan", source)
+    written = vsp.writeVSP3({"FUGWYXQTPNJ": 20.0}, source, target)
+    assert written == set(["FUGWYXQTPNJ"])
+    assert vsp.readParameters(target)["FUGWYXQTPNJ"].value == 20.0
+
+
+def test_vsp3_writes_attributes_in_any_order(workdir):
+    source = str(workdir / "sketch.vsp3")
+    target = str(workdir / "design.vsp3")
+    parms = vsp.readParameters(source)
+    with pytest.warns(UserWarning, match="NOSUCHID"):
+        written = vsp.writeVSP3({"User_3": 2.5, "NOSUCHID": 1}, source, target)
+    assert written == set(["User_3"])
+    assert vsp.readParameters(target)["User_3"].value == 2.5
+    every = dict((key, 1.0) for key in parms)
+    assert vsp.writeVSP3(every, source, target) == set(parms)
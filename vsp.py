@@ -1,24 +1,179 @@
-def updateOpenVSP(inputDict):
-    print 'a tiger!'
-    filename = 'design.des'
-    with open(filename,'r+') as f:
-        result = f.read()
-        a = result.split('\n')
-        outputLines = []
-        for line in a:
+import os
+import re
+import json
+import warnings
+from collections import namedtuple
+from xml.etree.ElementTree import iterparse
+
+
+class DesFile(object):
+    """An OpenVSP .des parameter file, indexed by parameter ID
+
+    Lines look like `ID:Container:Group:Parm: value`; the index maps each ID
+    to its line so updates only reformat the entries that changed.
+    """
+    def __init__(self, filename='design.des'):
+        self.filename = filename
+        with open(filename, 'r') as f:
+            self.lines = f.read().split('\n')
+        self.index = {}
+        for i, line in enumerate(self.lines):
             words = line.split(':')
             if len(words) > 1:
-                key = words[0]
-                value = float(words[-1])
-                if key in inputDict:
-                    value = " " + str(inputDict[key])
+                self.index[words[0]] = i
+        self.changed = False
+
+    def update(self, inputDict):
+        "Sets parameter values by ID, returning the IDs that changed"
+        changed = []
+        for key, value in inputDict.items():
+            if key not in self.index:
+                continue
+            i = self.index[key]
+            words = self.lines[i].split(':')
+            value = " " + str(value)
+            if words[-1] != value:
                 words[-1] = value
-            outputLine = ":".join(words)
-            outputLines += [outputLine]
-        output = '\n'.join(outputLines)
+                self.lines[i] = ":".join(words)
+                changed.append(key)
+        self.changed = self.changed or bool(changed)
+        return changed
+
+    def text(self):
+        return '\n'.join(self.lines)
+
+    def save(self, filename=None):
+        "Writes the file if anything changed (or always, to a new filename)"
+        if filename is None:
+            if not self.changed:
+                return
+            filename = self.filename
+        with open(filename, 'w') as f:
+            f.write(self.text())
+        if filename == self.filename:
+            self.changed = False
+
+
+def updateOpenVSP(inputDict, filename='design.des', verbose=False):
+    "Updates parameter values in a .des file in place"
+    des = DesFile(filename)
+    des.update(inputDict)
+    des.save()
+    if verbose:
         print('OpenVSP .des output:')
-        print(output)
-        f.seek(0)
-        f.write(output)
-        f.truncate()
-        f.close()
\ No newline at end of file
+        print(des.text())
+    return des
+
+
+def writeDesFiles(designs, template='design.des', directory='.',
+                  pattern='design_%d.des'):
+    """Writes one .des file per design, streaming through an iterable
+
+    Each design is an inputDict of ID -> value applied to the template;
+    yields the path written for each design as it goes.
+    """
+    des = DesFile(template)
+    base = list(des.lines)
+    for i, inputDict in enumerate(designs):
+        des.lines = list(base)
+        des.update(inputDict)
+        path = os.path.join(directory, pattern % i)
+        des.save(path)
+        yield path
+
+
+# A .vsp3 parameter: tag path, "Container:Group:Parm" name and value
+Parm = namedtuple('Parm', 'path name value')
+
+# Parameter elements in a .vsp3 file, e.g. <TotalSpan Value="..." ID="..."/>;
+# attributes come in any order (UserParm puts Name, Descript... after ID)
+PARM_RE = re.compile(r'<\w+\s[^<>]*?\bID="(\w+)"[^<>]*>')
+VALUE_RE = re.compile(r'(\bValue=")[^"]*(")')
+
+
+def readParameters(filename='sketch.vsp3'):
+    """Builds an ID -> Parm index of every parameter in a .vsp3 file
+
+    Streams the XML with iterparse, clearing elements as they close, so the
+    whole DOM is never held in memory.
+    """
+    parms = {}
+    path = []
+    containers = []
+    for event, elem in iterparse(filename, events=('start', 'end')):
+        if event == 'start':
+            path.append(elem.tag)
+            if elem.tag == 'ParmContainer':
+                containers.append('')
+            continue
+        path.pop()
+        if elem.tag == 'Name' and path and path[-1] == 'ParmContainer':
+            containers[-1] = elem.text or ''
+        elif elem.tag == 'ParmContainer':
+            containers.pop()
+        elif 'Value' in elem.attrib and 'ID' in elem.attrib:
+            group = path[-1] if path else ''
+            container = containers[-1] if containers else ''
+            parms[elem.attrib['ID']] = Parm(
+                '/'.join(path + [elem.tag]),
+                ':'.join([container, group, elem.tag]),
+                float(elem.attrib['Value']))
+        elem.clear()
+    return parms
+
+
+def parameterIndex(filename='sketch.vsp3'):
+    """The parameter index of a .vsp3 file, cached next to it
+
+    The cache (filename + '.idx') is rebuilt whenever the file's mtime
+    differs from the one it was built from.
+    """
+    cachename = filename + '.idx'
+    mtime = os.path.getmtime(filename)
+    if os.path.exists(cachename):
+        with open(cachename, 'r') as f:
+            cached = json.load(f)
+        if cached['mtime'] == mtime:
+            return dict((k, Parm(*v)) for k, v in cached['parms'].items())
+    parms = readParameters(filename)
+    with open(cachename, 'w') as f:
+        json.dump({'mtime': mtime, 'parms': parms}, f)
+    return parms
+
+
+def findParameters(name, filename='sketch.vsp3'):
+    "IDs of the parameters whose 'Container:Group:Parm' name ends with name"
+    return sorted(k for k, parm in parameterIndex(filename).items()
+                  if parm.name.endswith(name))
+
+
+def writeVSP3(inputDict, source='sketch.vsp3', target='design.vsp3'):
+    """Copies a .vsp3 file line by line, replacing parameter values by ID
+
+    Returns the IDs that were found and written; IDs of inputDict with no
+    Value attribute in the file are reported in a warning.
+    """
+    written = set()
+
+    def replace(match):
+        key = match.group(1)
+        if key not in inputDict:
+            return match.group(0)
+        value = '%.18e' % inputDict[key]
+        tag, n = VALUE_RE.subn(lambda m: m.group(1) + value + m.group(2),
+                               match.group(0), count=1)
+        if n:
+            written.add(key)
+        return tag
+
+    with open(source, 'r') as fin:
+        with open(target, 'w') as fout:
+            for line in fin:
+                if 'ID="' in line:
+                    line = PARM_RE.sub(replace, line)
+                fout.write(line)
+    missing = sorted(set(inputDict) - written)
+    if missing:
+        warnings.warn("parameters not found in %s, left unwritten: %s"
+                      % (source, ", ".join(missing)))
+    return written